@@ -7,9 +7,11 @@ Executes all 12 audit dimensions in parallel and generates comprehensive reports
 
 import os
 import json
+import math
 import argparse
 import asyncio
 import subprocess
+from array import array
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import sys
@@ -125,6 +127,28 @@ class ComprehensiveAuditor:
             }
         }
 
+        # Scalar result columns (score/confidence/status), one slot per dimension.
+        # self.results["dimensions"] keeps the full per-dimension dicts for reporting.
+        self._dim_names = list(self.dimensions)
+        self._dim_idx = {name: i for i, name in enumerate(self._dim_names)}
+        self._scores = array('d', [math.nan] * len(self._dim_names))
+        self._confidences = array('d', [math.nan] * len(self._dim_names))
+        self._statuses = [""] * len(self._dim_names)
+
+    def _record_dimension_result(self, dimension_key: str, result: Dict[str, Any]):
+        """Store a finished dimension result and its scalar columns"""
+        self.results["dimensions"][dimension_key] = result
+
+        i = self._dim_idx[dimension_key]
+        score = result.get("score")
+        self._scores[i] = math.nan if score is None else score
+        self._confidences[i] = result.get("confidence", self.dimensions[dimension_key]["confidence"])
+        self._statuses[i] = result.get("status", "")
+
+    def _completed_dimension_count(self) -> int:
+        """Number of dimensions that finished successfully"""
+        return self._statuses.count("success")
+
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """Load configuration from file"""
         default_config = {
@@ -276,7 +300,7 @@ class ComprehensiveAuditor:
                 dimension_key = future_to_dimension[future]
                 try:
                     result = future.result()
-                    self.results["dimensions"][dimension_key] = result
+                    self._record_dimension_result(dimension_key, result)
 
                     status_emoji = {"success": "✅", "failed": "❌", "timeout": "⏰", "error": "💥", "skipped": "⏭️"}
                     emoji = status_emoji.get(result["status"], "❓")
@@ -287,14 +311,14 @@ class ComprehensiveAuditor:
 
                 except Exception as e:
                     print(f"💥 {self.dimensions[dimension_key]['name']}: Exception - {e}")
-                    self.results["dimensions"][dimension_key] = {
+                    self._record_dimension_result(dimension_key, {
                         "dimension": dimension_key,
                         "status": "error",
                         "reason": str(e),
                         "findings": [],
                         "score": 0,
                         "confidence": self.dimensions[dimension_key]["confidence"]
-                    }
+                    })
 
         execution_time = time.time() - start_time
         self.results["metadata"]["execution_time"] = round(execution_time, 2)
@@ -303,24 +327,20 @@ class ComprehensiveAuditor:
 
     def calculate_overall_scores(self):
         """Calculate overall health score and confidence"""
-        total_weight = 0
-        weighted_score = 0
-        total_confidence = 0
-        confidence_count = 0
-
-        for dimension_key, dimension_config in self.dimensions.items():
-            if not dimension_config["enabled"]:
-                continue
-
-            weight = dimension_config["weight"]
-            result = self.results["dimensions"].get(dimension_key, {})
-            score = result.get("score", 0)
-            confidence = result.get("confidence", dimension_config["confidence"])
+        enabled = [i for i, name in enumerate(self._dim_names) if self.dimensions[name]["enabled"]]
+
+        # Dimensions without a score (not run or skipped) count as 0
+        weights = [self.dimensions[self._dim_names[i]]["weight"] for i in enabled]
+        scores = [0.0 if math.isnan(self._scores[i]) else self._scores[i] for i in enabled]
+        confidences = [
+            self.dimensions[self._dim_names[i]]["confidence"] if math.isnan(self._confidences[i]) else self._confidences[i]
+            for i in enabled
+        ]
 
-            total_weight += weight
-            weighted_score += score * weight
-            total_confidence += confidence
-            confidence_count += 1
+        total_weight = sum(weights)
+        weighted_score = sum(score * weight for score, weight in zip(scores, weights))
+        total_confidence = sum(confidences)
+        confidence_count = len(enabled)
 
         # Calculate weighted scores
         if total_weight > 0:
@@ -372,14 +392,15 @@ class ComprehensiveAuditor:
         """Generate actionable recommendations based on findings"""
         recommendations = []
 
-        # Analyze critical issues
+        # Analyze critical issues (NaN scores compare False, so unscored dimensions are never flagged)
         critical_issues = []
-        for dimension_key, result in self.results["dimensions"].items():
-            if result.get("score", 100) < 50:
+        for i, score in enumerate(self._scores):
+            if score < 50:
+                dimension_key = self._dim_names[i]
                 critical_issues.append({
                     "dimension": dimension_key,
                     "dimension_name": self.dimensions[dimension_key]["name"],
-                    "score": result.get("score", 0),
+                    "score": self.results["dimensions"][dimension_key]["score"],
                     "confidence": self.dimensions[dimension_key]["confidence"]
                 })
 
@@ -402,8 +423,8 @@ class ComprehensiveAuditor:
         # Generate cross-dimension recommendations
         # Look for patterns like: low confidence + critical issues
         high_risk_dimensions = [
-            key for key, result in self.results["dimensions"].items()
-            if result.get("score", 100) < 60 and self.dimensions[key]["confidence"] < 70
+            self._dim_names[i] for i, (score, confidence) in enumerate(zip(self._scores, self._confidences))
+            if score < 60 and confidence < 70
         ]
 
         if high_risk_dimensions:
@@ -468,6 +489,23 @@ class ComprehensiveAuditor:
 
         return str(result_file)
 
+    def save_single_dimension_result(self, dimension_key: str, output_dir: str = ".") -> str:
+        """Save the result of a single dimension run without the aggregate sections"""
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        result_file = output_path / f"comprehensive_audit_{dimension_key}_{timestamp}.json"
+
+        with open(result_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "metadata": self.results["metadata"],
+                "dimension": self.results["dimensions"][dimension_key]
+            }, f, indent=2, default=str)
+
+        print(f"📊 Dimension result saved to: {result_file}")
+        return str(result_file)
+
     def _generate_report(self, output_path: Path, timestamp: str) -> Path:
         """Generate human-readable audit report"""
         report_file = output_path / f"comprehensive_audit_report_{timestamp}.md"
@@ -492,7 +530,7 @@ class ComprehensiveAuditor:
             f"",
             f"**Overall Health Score:** {self.results['overall_health_score']}/100 ({self.results['metadata']['health_status']})",
             f"**Overall Confidence:** {self.results['overall_confidence']}%",
-            f"**Dimensions Audited:** {len([d for d in self.results['dimensions'].values() if d.get('status') == 'success'])}/12",
+            f"**Dimensions Audited:** {self._completed_dimension_count()}/12",
             f""
         ]
 
@@ -605,8 +643,10 @@ def main():
                 return 1
 
             result = auditor.run_dimension_audit(args.dimension, dimension_config)
-            auditor.results["dimensions"][args.dimension] = result
+            auditor._record_dimension_result(args.dimension, result)
             print(f"✅ Dimension '{args.dimension}' completed")
+
+            auditor.save_single_dimension_result(args.dimension, args.output)
         else:
             # Run all dimensions
             auditor.run_parallel_audits(args.quick)
@@ -618,10 +658,10 @@ def main():
             print(f"\n📊 Audit Summary:")
             print(f"   Overall Health: {auditor.results['overall_health_score']}/100 ({auditor.results['metadata']['health_status']})")
             print(f"   Overall Confidence: {auditor.results['overall_confidence']}%")
-            print(f"   Dimensions Completed: {len([d for d in auditor.results['dimensions'].values() if d.get('status') == 'success'])}")
+            print(f"   Dimensions Completed: {auditor._completed_dimension_count()}")
 
-        # Save results
-        result_file = auditor.save_results(args.output)
+            # Save results
+            result_file = auditor.save_results(args.output)
 
         print(f"\n🎉 Comprehensive audit completed!")
         return 0
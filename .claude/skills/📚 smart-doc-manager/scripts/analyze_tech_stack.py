@@ -11,15 +11,253 @@ Output: JSON report of detected technologies with confidence scores
 """
 
 import os
+import ast
 import json
+import hashlib
 import re
 import subprocess
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+# Directories that hold vendored or generated code and are never descended into
+SKIP_DIRS = frozenset({
+    'node_modules', '.git', 'target', 'vendor', '__pycache__',
+    'dist', 'build', '.next', 'coverage'
+})
+
+DEPENDENCY_FILENAMES = frozenset({
+    "package.json", "package-lock.json", "yarn.lock",
+    "requirements.txt", "requirements-dev.txt", "Pipfile", "poetry.lock",
+    "Cargo.toml", "Cargo.lock",
+    "go.mod", "go.sum",
+    "pom.xml", "build.gradle", "build.gradle.kts",
+    "composer.json", "composer.lock",
+    "Gemfile", "Gemfile.lock",
+    "mix.exs", "rebar.lock"
+})
+
+# Pinned requirement sets such as requirements-test.txt or requirements_prod.txt
+REQUIREMENTS_FILE_PATTERN = re.compile(r'requirements[-_.][\w.-]+\.txt')
+
+CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.py', '.rs', '.go')
+
+# Bundled output is one huge line of generated code with no useful imports
+MINIFIED_SUFFIXES = ('.min.js', '.min.mjs', '.bundle.js')
+MAX_CODE_FILE_SIZE = 1_048_576
+
+CONFIG_FILENAMES = frozenset({
+    'docker-compose.yml', 'docker-compose.yaml', 'Dockerfile',
+    'tsconfig.json', 'webpack.config.js', 'vite.config.js',
+    'pytest.ini', 'tox.ini', 'setup.cfg'
+})
+
+# YAML manifests inside any of these directories count as Kubernetes config
+KUBERNETES_DIRS = frozenset({'kubernetes', 'k8s', 'kube'})
+YAML_EXTENSIONS = ('.yml', '.yaml')
+
+_VERSION_SPLIT = re.compile(r'[<>=!~;\s]').split
+_DEP_TOKEN_SPLIT = re.compile(r'[@/._-]+').split
+
+# Saved analyses live under the project root, keyed by the scanned files and the
+# analyzer version; bump the version whenever the analysis output changes
+CACHE_DIR_NAME = '.tech_stack_cache'
+ANALYSIS_CACHE_VERSION = b'1'
+
+# Minimum number of code files before import scanning fans out to worker processes
+PARALLEL_SCAN_THRESHOLD = 64
+
+# Patterns are anchored with a leading \\s* so lines can be matched without stripping
+IMPORT_PATTERNS = {
+    'TypeScript/JavaScript': [
+        (re.compile(r'^\s*import.*from [\'"]([a-zA-Z0-9@/-]+)[\'"]', re.MULTILINE), 'npm'),
+        (re.compile(r'^\s*const\s+\w+\s*=\s*require\([\'"]([a-zA-Z0-9@/-]+)[\'"]\)', re.MULTILINE), 'npm'),
+        (re.compile(r'^\s*import\s+[\'"]([a-zA-Z0-9@/-]+)[\'"]', re.MULTILINE), 'node_builtin'),
+    ],
+    'Python': [
+        (re.compile(r'^\s*import\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.MULTILINE), 'python'),
+        (re.compile(r'^\s*from\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+import', re.MULTILINE), 'python'),
+    ],
+    'Rust': [
+        (re.compile(r'^\s*use\s+([a-zA-Z_][a-zA-Z0-9_:]*)', re.MULTILINE), 'rust'),
+        (re.compile(r'^\s*extern\s+crate\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.MULTILINE), 'rust'),
+    ],
+    'Go': [
+        (re.compile(r'^\s*import\s+[\'"]([a-zA-Z0-9_/.-]+)[\'"]', re.MULTILINE), 'go'),
+    ]
+}
+
+PATTERNS_BY_EXTENSION = {
+    '.ts': IMPORT_PATTERNS['TypeScript/JavaScript'],
+    '.tsx': IMPORT_PATTERNS['TypeScript/JavaScript'],
+    '.js': IMPORT_PATTERNS['TypeScript/JavaScript'],
+    '.jsx': IMPORT_PATTERNS['TypeScript/JavaScript'],
+    '.py': IMPORT_PATTERNS['Python'],
+    '.rs': IMPORT_PATTERNS['Rust'],
+    '.go': IMPORT_PATTERNS['Go'],
+}
+
+
+def _scan_python_imports(content: str, filename: str) -> Set[str]:
+    """Collect top-level module names from absolute imports; raises SyntaxError/ValueError on unparsable source"""
+    modules = set()
+    for node in ast.walk(ast.parse(content, filename=filename)):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module.split('.')[0])
+    return modules
+
+
+def _scan_file(path_str: str) -> Dict[str, Set[str]]:
+    """Collect imported module names from a single code file, grouped by import type"""
+    file_path = Path(path_str)
+    file_imports = {}
+
+    # Detect language from extension
+    patterns = PATTERNS_BY_EXTENSION.get(file_path.suffix.lower())
+    if patterns is None:
+        return file_imports
+
+    try:
+        if file_path.stat().st_size > MAX_CODE_FILE_SIZE:
+            return file_imports
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            if file_path.suffix.lower() != '.py':
+                # Regex-scanned languages never need the whole file in memory
+                _match_import_lines(f, patterns, file_imports)
+                return file_imports
+            content = f.read()
+    except (UnicodeDecodeError, OSError):
+        return file_imports
+
+    try:
+        modules = _scan_python_imports(content, path_str)
+    except (SyntaxError, ValueError):
+        # Fall back to line-based regex matching
+        _match_import_lines(content.splitlines(), patterns, file_imports)
+    else:
+        if modules:
+            file_imports['python'] = modules
+
+    return file_imports
+
+
+def _match_import_lines(lines, patterns, file_imports: Dict[str, Set[str]]):
+    """Add regex import matches from an iterable of lines to file_imports"""
+    for line in lines:
+        for pattern, import_type in patterns:
+            match = pattern.match(line)
+            if match:
+                file_imports.setdefault(import_type, set()).add(match.group(1))
+
+
+class EvidenceSource(Enum):
+    DEPENDENCY = "DEPENDENCY"
+    IMPORT = "IMPORT"
+    CONFIG = "CONFIG"
+
+# Each evidence item scores only for the source it was tagged with, never for words in its file path
+EVIDENCE_WEIGHTS = {
+    EvidenceSource.DEPENDENCY: 40,  # Evidence from dependencies = high confidence
+    EvidenceSource.IMPORT: 30,      # Evidence from code imports = high confidence
+    EvidenceSource.CONFIG: 20,      # Evidence from config files = medium confidence
+}
+
+
+def _build_tech_index(tech_categories: Dict[str, Set[str]]) -> Tuple[Dict[str, Set[str]], Dict[str, re.Pattern]]:
+    """Build a token -> categories lookup plus one substring matcher per category"""
+    tech_lookup = {}
+    for category, techs in tech_categories.items():
+        for tech in techs:
+            tech_lookup.setdefault(tech, set()).add(category)
+
+    tech_matchers = {
+        category: re.compile('|'.join(re.escape(tech) for tech in sorted(techs, key=len, reverse=True)))
+        for category, techs in tech_categories.items()
+    }
+    return tech_lookup, tech_matchers
+
+
+def _categorize_dependency(dep_lower: str, tech_lookup: Dict[str, Set[str]],
+                           tech_matchers: Dict[str, re.Pattern]) -> Set[str]:
+    """Return the categories whose technology names occur in a lowercased dependency name"""
+    categories = set()
+
+    # Exact name or scope/segment hits resolve with plain set lookups
+    for token in _DEP_TOKEN_SPLIT(dep_lower):
+        categories.update(tech_lookup.get(token, ()))
+
+    # Remaining categories still match on substrings (e.g. "vitejs" -> "vite")
+    for category, matcher in tech_matchers.items():
+        if category not in categories and matcher.search(dep_lower):
+            categories.add(category)
+
+    return categories
+
+
 class TechStackAnalyzer:
-    def __init__(self, project_root: str = "."):
+    NPM_TECH_CATEGORIES = {
+        'frameworks': {
+            'react', 'vue', 'angular', 'svelte', 'next', 'nuxt', 'gatsby',
+            'express', 'fastify', 'koa', 'hapi', 'nest', 'nestjs',
+            'django', 'flask', 'rails', 'laravel', 'spring'
+        },
+        'databases': {
+            'pg', 'postgres', 'mysql', 'mysql2', 'mongodb', 'mongoose',
+            'redis', 'ioredis', 'sqlite', 'sqlite3', 'prisma',
+            'typeorm', 'sequelize', 'knex'
+        },
+        'testing': {
+            'jest', 'mocha', 'jasmine', 'cypress', 'playwright',
+            'vitest', 'testing-library', 'chai', 'sinon'
+        },
+        'build_tools': {
+            'webpack', 'rollup', 'vite', 'parcel', 'esbuild',
+            'babel', 'postcss', 'sass', 'less', 'stylus'
+        },
+        'deployment': {
+            'docker', 'kubernetes', 'k8s', 'helm', 'terraform',
+            'aws-sdk', 'azure-sdk', 'gcp', 'firebase'
+        },
+        'storage': {
+            'aws-sdk', 'aws-s3', 'minio', 'google-cloud-storage',
+            'azure-storage', 'multer', 'sharp', 'jimp'
+        }
+    }
+
+    PYTHON_TECH_CATEGORIES = {
+        'frameworks': {
+            'django', 'flask', 'fastapi', 'starlette', 'tornado',
+            'aiohttp', 'sanic', 'pyramid', 'bottle', 'cherrypy'
+        },
+        'databases': {
+            'psycopg2', 'pg', 'mysqlclient', 'mysql-connector',
+            'pymongo', 'redis', 'aioredis', 'sqlite',
+            'sqlalchemy', 'alembic', 'peewee', 'pony'
+        },
+        'testing': {
+            'pytest', 'unittest', 'nose', 'doctest',
+            'factory-boy', 'faker', 'mock', 'responses'
+        },
+        'deployment': {
+            'gunicorn', 'uvicorn', 'uwsgi', 'mod-wsgi',
+            'docker', 'kubernetes', 'heroku'
+        },
+        'storage': {
+            'boto3', 'botocore', 'google-cloud-storage',
+            'azure-storage', 'pillow', 'opencv-python'
+        }
+    }
+
+    _NPM_TECH_INDEX = _build_tech_index(NPM_TECH_CATEGORIES)
+    _PYTHON_TECH_INDEX = _build_tech_index(PYTHON_TECH_CATEGORIES)
+
+    def __init__(self, project_root: str = ".", use_cache: bool = True):
         self.project_root = Path(project_root)
+        self.use_cache = use_cache
         self.detected_stack = {
             "languages": set(),
             "frameworks": set(),
@@ -31,25 +269,74 @@ class TechStackAnalyzer:
         }
         self.confidence = {}
         self.detection_method = {}
+        self._tree_scan = None
 
-    def find_dependency_files(self) -> List[Path]:
-        """Find all package/dependency files in the project"""
-        patterns = [
-            "package.json", "package-lock.json", "yarn.lock",
-            "requirements.txt", "requirements-dev.txt", "Pipfile", "poetry.lock",
-            "Cargo.toml", "Cargo.lock",
-            "go.mod", "go.sum",
-            "pom.xml", "build.gradle", "build.gradle.kts",
-            "composer.json", "composer.lock",
-            "Gemfile", "Gemfile.lock",
-            "mix.exs", "rebar.lock"
-        ]
+    def _scan_tree(self) -> Tuple[List[Path], List[Path], List[Path]]:
+        """Walk the project once, classifying files as (dependency, code, config) files"""
+        if self._tree_scan is not None:
+            return self._tree_scan
+
+        dep_files = []
+        code_files = []
+        config_files = []
+
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            dir_path = Path(dirpath)
+            rel_parts = dir_path.relative_to(self.project_root).parts
+            in_kubernetes_dir = any(part in KUBERNETES_DIRS for part in rel_parts)
+            in_workflows_dir = rel_parts[-2:] == ('.github', 'workflows')
+
+            for filename in filenames:
+                if filename in DEPENDENCY_FILENAMES or REQUIREMENTS_FILE_PATTERN.fullmatch(filename):
+                    dep_files.append(dir_path / filename)
+                if filename.endswith(CODE_EXTENSIONS) and not filename.endswith(MINIFIED_SUFFIXES):
+                    code_files.append(dir_path / filename)
+                if filename in CONFIG_FILENAMES:
+                    config_files.append(dir_path / filename)
+                elif (in_kubernetes_dir or in_workflows_dir) and filename.endswith(YAML_EXTENSIONS):
+                    config_files.append(dir_path / filename)
+
+        self._tree_scan = (dep_files, code_files, config_files)
+        return self._tree_scan
+
+    def _cache_key(self) -> str:
+        """Hash the analyzer version plus path, mtime and size of every scanned file into a cache key"""
+        dep_files, code_files, config_files = self._scan_tree()
+        digest = hashlib.blake2b(ANALYSIS_CACHE_VERSION)
+        for file_path in sorted(set(dep_files + code_files + config_files)):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            digest.update(f"{file_path}:{stat.st_mtime}:{stat.st_size}\n".encode())
+        return digest.hexdigest()
 
-        found_files = []
-        for pattern in patterns:
-            found_files.extend(self.project_root.rglob(pattern))
+    def _load_cached_result(self, cache_file: Path) -> Dict:
+        """Return a previously saved analysis, or None when missing or unreadable"""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
 
-        return found_files
+    def _save_cached_result(self, cache_file: Path, result: Dict):
+        """Persist an analysis result as the only cache entry; caching failures never abort the analysis"""
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            # Entries for older trees or analyzer versions can never hit again
+            for stale_file in cache_file.parent.glob('*.json'):
+                if stale_file != cache_file:
+                    stale_file.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"⚠️ Could not write cache {cache_file}: {e}")
+
+    def find_dependency_files(self) -> List[Path]:
+        """Find all package/dependency files in the project"""
+        dep_files, _, _ = self._scan_tree()
+        return dep_files
 
     def analyze_package_json(self, file_path: Path) -> Dict:
         """Analyze Node.js package.json for dependencies"""
@@ -62,41 +349,11 @@ class TechStackAnalyzer:
                 if dep_type in data:
                     deps.update(data[dep_type])
 
-            tech_categories = {
-                'frameworks': {
-                    'react', 'vue', 'angular', 'svelte', 'next', 'nuxt', 'gatsby',
-                    'express', 'fastify', 'koa', 'hapi', 'nest', 'nestjs',
-                    'django', 'flask', 'rails', 'laravel', 'spring'
-                },
-                'databases': {
-                    'pg', 'postgres', 'mysql', 'mysql2', 'mongodb', 'mongoose',
-                    'redis', 'ioredis', 'sqlite', 'sqlite3', 'prisma',
-                    'typeorm', 'sequelize', 'knex'
-                },
-                'testing': {
-                    'jest', 'mocha', 'jasmine', 'cypress', 'playwright',
-                    'vitest', 'testing-library', 'chai', 'sinon'
-                },
-                'build_tools': {
-                    'webpack', 'rollup', 'vite', 'parcel', 'esbuild',
-                    'babel', 'postcss', 'sass', 'less', 'stylus'
-                },
-                'deployment': {
-                    'docker', 'kubernetes', 'k8s', 'helm', 'terraform',
-                    'aws-sdk', 'azure-sdk', 'gcp', 'firebase'
-                },
-                'storage': {
-                    'aws-sdk', 'aws-s3', 'minio', 'google-cloud-storage',
-                    'azure-storage', 'multer', 'sharp', 'jimp'
-                }
-            }
-
-            detected = {category: set() for category in tech_categories}
+            detected = {category: set() for category in self.NPM_TECH_CATEGORIES}
 
             for dep_name in deps.keys():
-                for category, techs in tech_categories.items():
-                    if any(tech in dep_name.lower() for tech in techs):
-                        detected[category].add(dep_name)
+                for category in _categorize_dependency(dep_name.lower(), *self._NPM_TECH_INDEX):
+                    detected[category].add(dep_name)
 
             return detected
 
@@ -106,50 +363,22 @@ class TechStackAnalyzer:
     def analyze_requirements_txt(self, file_path: Path) -> Dict:
         """Analyze Python requirements.txt for dependencies"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
             # Extract package names (handle various formats)
             packages = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    # Extract package name before version specifier
-                    package = re.split(r'[<>=!]', line)[0].strip()
-                    if package:
-                        packages.append(package)
-
-            tech_categories = {
-                'frameworks': {
-                    'django', 'flask', 'fastapi', 'starlette', 'tornado',
-                    'aiohttp', 'sanic', 'pyramid', 'bottle', 'cherrypy'
-                },
-                'databases': {
-                    'psycopg2', 'pg', 'mysqlclient', 'mysql-connector',
-                    'pymongo', 'redis', 'aioredis', 'sqlite',
-                    'sqlalchemy', 'alembic', 'peewee', 'pony'
-                },
-                'testing': {
-                    'pytest', 'unittest', 'nose', 'doctest',
-                    'factory-boy', 'faker', 'mock', 'responses'
-                },
-                'deployment': {
-                    'gunicorn', 'uvicorn', 'uwsgi', 'mod-wsgi',
-                    'docker', 'kubernetes', 'heroku'
-                },
-                'storage': {
-                    'boto3', 'botocore', 'google-cloud-storage',
-                    'azure-storage', 'pillow', 'opencv-python'
-                }
-            }
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        # Extract package name before version specifier or environment marker
+                        package = _VERSION_SPLIT(line)[0].strip()
+                        if package:
+                            packages.append(package)
 
-            detected = {category: set() for category in tech_categories}
+            detected = {category: set() for category in self.PYTHON_TECH_CATEGORIES}
 
             for package in packages:
-                package_lower = package.lower()
-                for category, techs in tech_categories.items():
-                    if any(tech in package_lower for tech in techs):
-                        detected[category].add(package)
+                for category in _categorize_dependency(package.lower(), *self._PYTHON_TECH_INDEX):
+                    detected[category].add(package)
 
             return detected
 
@@ -158,28 +387,8 @@ class TechStackAnalyzer:
 
     def analyze_code_imports(self) -> Dict[str, Set[str]]:
         """Analyze code files for import statements to detect actual usage"""
-        import_patterns = {
-            'TypeScript/JavaScript': [
-                (r'^import.*from [\'"]([a-zA-Z0-9@/-]+)[\'"]', 'npm'),
-                (r'^const\s+\w+\s*=\s*require\([\'"]([a-zA-Z0-9@/-]+)[\'"]\)', 'npm'),
-                (r'^import\s+[\'"]([a-zA-Z0-9@/-]+)[\'"]', 'node_builtin'),
-            ],
-            'Python': [
-                (r'^import\s+([a-zA-Z_][a-zA-Z0-9_]*)', 'python'),
-                (r'^from\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+import', 'python'),
-            ],
-            'Rust': [
-                (r'^use\s+([a-zA-Z_][a-zA-Z0-9_:]*)', 'rust'),
-                (r'^extern\s+crate\s+([a-zA-Z_][a-zA-Z0-9_]*)', 'rust'),
-            ],
-            'Go': [
-                (r'^import\s+[\'"]([a-zA-Z0-9_/.-]+)[\'"]', 'go'),
-            ]
-        }
-
-        code_files = []
-        for pattern in ['**/*.ts', '**/*.tsx', '**/*.js', '**/*.jsx', '**/*.py', '**/*.rs', '**/*.go']:
-            code_files.extend(self.project_root.rglob(pattern))
+        _, code_paths, _ = self._scan_tree()
+        code_files = [str(file_path) for file_path in code_paths]
 
         detected_imports = {
             'npm': set(),
@@ -189,54 +398,22 @@ class TechStackAnalyzer:
             'node_builtin': set()
         }
 
-        for file_path in code_files:
-            # Skip node_modules and other dependency directories
-            if any(skip in str(file_path) for skip in ['node_modules', 'target', 'vendor', '.git']):
-                continue
-
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                # Detect language from extension
-                ext = file_path.suffix.lower()
-                if ext in ['.ts', '.tsx', '.js', '.jsx']:
-                    patterns = import_patterns['TypeScript/JavaScript']
-                elif ext == '.py':
-                    patterns = import_patterns['Python']
-                elif ext == '.rs':
-                    patterns = import_patterns['Rust']
-                elif ext == '.go':
-                    patterns = import_patterns['Go']
-                else:
-                    continue
-
-                for line in content.split('\n'):
-                    for pattern, import_type in patterns:
-                        match = re.match(pattern, line.strip())
-                        if match:
-                            module_name = match.group(1)
-                            detected_imports[import_type].add(module_name)
+        # Spawning workers costs more than it saves on small trees
+        if len(code_files) > PARALLEL_SCAN_THRESHOLD:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_scan_file, code_files, chunksize=32))
+        else:
+            results = [_scan_file(path_str) for path_str in code_files]
 
-            except (UnicodeDecodeError, PermissionError):
-                continue
+        for file_imports in results:
+            for import_type, modules in file_imports.items():
+                detected_imports[import_type].update(modules)
 
         return detected_imports
 
     def analyze_configuration_files(self) -> Dict:
         """Analyze configuration files for tech stack indicators"""
-        config_files = []
-        patterns = [
-            'docker-compose.yml', 'docker-compose.yaml', 'Dockerfile',
-            'kubernetes/**/*.yaml', 'k8s/**/*.yaml', 'kube/**/*.yaml',
-            '.github/workflows/*.yml', '.github/workflows/*.yaml',
-            'tsconfig.json', 'webpack.config.js', 'vite.config.js',
-            'pytest.ini', 'tox.ini', 'setup.cfg'
-        ]
-
-        for pattern in patterns:
-            config_files.extend(self.project_root.glob(pattern))
-            config_files.extend(self.project_root.rglob(pattern))
+        _, _, config_files = self._scan_tree()
 
         detected = {
             'deployment': set(),
@@ -288,28 +465,10 @@ class TechStackAnalyzer:
 
         return detected
 
-    def calculate_confidence(self, tech: str, evidence: List[str]) -> int:
+    def calculate_confidence(self, tech: str, evidence: List[Tuple[str, EvidenceSource]]) -> int:
         """Calculate confidence score based on evidence strength"""
-        confidence = 0
-
-        # Evidence from dependencies = high confidence
-        dep_files = ['package.json', 'requirements.txt', 'Cargo.toml']
-        for evidence_item in evidence:
-            for dep_file in dep_files:
-                if dep_file in evidence_item:
-                    confidence += 40
-
-        # Evidence from code imports = high confidence
-        code_patterns = ['import', 'from', 'use', 'require']
-        for evidence_item in evidence:
-            if any(pattern in evidence_item for pattern in code_patterns):
-                confidence += 30
-
-        # Evidence from config files = medium confidence
-        config_patterns = ['docker', 'kubernetes', 'config']
-        for evidence_item in evidence:
-            if any(pattern in evidence_item for pattern in config_patterns):
-                confidence += 20
+        source_counts = Counter(source for _, source in evidence)
+        confidence = sum(EVIDENCE_WEIGHTS[source] * count for source, count in source_counts.items())
 
         # Multiple mentions increase confidence
         confidence += min(len(evidence) * 5, 20)
@@ -320,6 +479,14 @@ class TechStackAnalyzer:
         """Main analysis method"""
         print("🔍 Analyzing technology stack...")
 
+        cache_file = None
+        if self.use_cache:
+            cache_file = self.project_root / CACHE_DIR_NAME / f"{self._cache_key()}.json"
+            cached = self._load_cached_result(cache_file)
+            if cached is not None:
+                print(f"♻️ Using cached analysis: {cache_file}")
+                return cached
+
         # Find and analyze dependency files
         dep_files = self.find_dependency_files()
         print(f"📦 Found {len(dep_files)} dependency files")
@@ -332,7 +499,7 @@ class TechStackAnalyzer:
                 for category, techs in detected.items():
                     self.detected_stack[category].update(techs)
                     for tech in techs:
-                        evidence = [f"Found in {dep_file.relative_to(self.project_root)}"]
+                        evidence = [(f"Found in {dep_file.relative_to(self.project_root)}", EvidenceSource.DEPENDENCY)]
                         self.detection_method[tech] = evidence
                         self.confidence[tech] = self.calculate_confidence(tech, evidence)
 
@@ -341,7 +508,7 @@ class TechStackAnalyzer:
                 for category, techs in detected.items():
                     self.detected_stack[category].update(techs)
                     for tech in techs:
-                        evidence = [f"Found in {dep_file.relative_to(self.project_root)}"]
+                        evidence = [(f"Found in {dep_file.relative_to(self.project_root)}", EvidenceSource.DEPENDENCY)]
                         self.detection_method[tech] = evidence
                         self.confidence[tech] = self.calculate_confidence(tech, evidence)
 
@@ -368,7 +535,10 @@ class TechStackAnalyzer:
                 for category, techs in self.detected_stack.items()
             },
             "confidence": self.confidence,
-            "detection_method": self.detection_method,
+            "detection_method": {
+                tech: [description for description, _ in evidence]
+                for tech, evidence in self.detection_method.items()
+            },
             "summary": {
                 "total_technologies": sum(len(techs) for techs in self.detected_stack.values()),
                 "high_confidence_count": len([c for c in self.confidence.values() if c >= 80]),
@@ -376,6 +546,9 @@ class TechStackAnalyzer:
             }
         }
 
+        if cache_file is not None:
+            self._save_cached_result(cache_file, result)
+
         return result
 
 def main():
@@ -385,10 +558,11 @@ def main():
     parser.add_argument('--project-root', default='.', help='Project root directory')
     parser.add_argument('--output', help='Output JSON file path')
     parser.add_argument('--pretty', action='store_true', help='Pretty print JSON output')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not write the on-disk analysis cache')
 
     args = parser.parse_args()
 
-    analyzer = TechStackAnalyzer(args.project_root)
+    analyzer = TechStackAnalyzer(args.project_root, use_cache=not args.no_cache)
     result = analyzer.analyze()
 
     if args.output:
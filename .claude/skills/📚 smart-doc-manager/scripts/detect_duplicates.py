@@ -11,22 +11,69 @@ Finds duplicate and near-duplicate documentation using:
 
 import os
 import re
+import sys
 import json
 import hashlib
+import unicodedata
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
 from dataclasses import dataclass
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import math
 
+try:
+    from datasketch import MinHash
+except ImportError:  # Optional: only needed for --lsh candidate generation
+    MinHash = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON output, stdlib json otherwise
+    orjson = None
+
+MINHASH_PERMUTATIONS = 128
+
+# Vocabulary Jaccard runs well below TF cosine for partially overlapping
+# documents, so LSH bands are tuned to a fraction of the cosine threshold
+LSH_THRESHOLD_RATIO = 0.5
+
+# Minimum number of files before loading fans out to worker processes
+PARALLEL_LOAD_THRESHOLD = 64
+
+# Reference documents used to bound pair similarities without computing them
+SIMILARITY_PIVOTS = 8
+
+_MD_SYNTAX = re.compile(r'[#*`_\[\]()~]')
+_MD_IMG = re.compile(r'!\[.*?\]\(.*?\)')
+_MD_LINK = re.compile(r'\[.*?\]\(.*?\)')
+_WS = re.compile(r'\s+')
+_WORD = re.compile(r'\b\w+\b')
+_TOPIC_WORD = re.compile(r'\b[a-z]{3,}\b')
+
+# Common words ignored when extracting topics
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
+    'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when',
+    'where', 'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more',
+    'most', 'other', 'some', 'such', 'only', 'own', 'same', 'so', 'than',
+    'too', 'very', 'just', 'now', 'use', 'used', 'using', 'file', 'files'
+})
+
 @dataclass
 class DocumentInfo:
     file_path: str
     content: str
     word_count: int
     size_kb: float
-    last_modified: str
-    hash_md5: str
+    last_modified: float
+    canonical_hash: str          # Digest ignoring case, whitespace and Unicode compatibility forms
+    term_counts: Counter = None  # Word counts of the preprocessed text
+    norm: float = 0.0            # Euclidean length of term_counts
+    topics: Set[str] = None      # Top keywords from extract_topics
 
 @dataclass
 class DuplicateResult:
@@ -38,42 +85,77 @@ class DuplicateResult:
     shared_topics: List[str] = None
 
 class DocumentationDuplicateDetector:
-    def __init__(self, docs_dir: str = "docs", similarity_threshold: float = 0.90):
+    def __init__(self, docs_dir: str = "docs", similarity_threshold: float = 0.90, use_lsh: bool = False):
         self.docs_dir = Path(docs_dir)
         self.similarity_threshold = similarity_threshold
+        self.use_lsh = use_lsh
+        if use_lsh and MinHash is None:
+            print("⚠️ datasketch not installed, comparing every document pair")
+            self.use_lsh = False
         self.documents = []
         self.exact_duplicates = []
         self.near_duplicates = []
         self.overlapping_docs = []
+        self._minhashes = None
+        self._similarities = {}
+        self._pivot_profiles = None
+        self._rarity_orders = None
 
-    def find_documentation_files(self) -> List[Path]:
-        """Find all documentation files"""
+    def find_documentation_files(self) -> List[Tuple[Path, os.stat_result]]:
+        """Find all documentation files, paired with their stat results from the scan"""
         doc_extensions = {'.md', '.rst', '.txt', '.adoc'}
         doc_files = []
 
-        for ext in doc_extensions:
-            doc_files.extend(self.docs_dir.rglob(f'*{ext}'))
+        # One scandir pass over the tree (top-down, like os.walk), filtering by suffix inline
+        pending = [self.docs_dir]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            subdirs = []
+            with entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in doc_extensions:
+                        try:
+                            doc_files.append((Path(entry.path), entry.stat()))
+                        except OSError:
+                            continue
+            pending.extend(reversed(subdirs))
 
         return doc_files
 
-    def load_document(self, file_path: Path) -> DocumentInfo:
+    def load_document(self, file_path: Path, stat: os.stat_result = None) -> DocumentInfo:
         """Load document content and metadata"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Reuse the scan's stat for size and mtime; bytes are decoded once below
+            if stat is None:
+                stat = file_path.stat()
+            raw = file_path.read_bytes()
+            content = raw.decode('utf-8')
 
             # Calculate word count
-            words = re.findall(r'\b\w+\b', content)
+            words = _WORD.findall(content)
             word_count = len(words)
 
             # Get file size in KB
-            size_kb = os.path.getsize(file_path) / 1024
+            size_kb = stat.st_size / 1024
 
             # Get last modified time
-            last_modified = str(os.path.getmtime(file_path))
+            last_modified = stat.st_mtime
 
-            # Calculate MD5 hash
-            hash_md5 = hashlib.md5(content.encode('utf-8')).hexdigest()
+            # Hash a canonical form, so trivially reformatted copies count as exact duplicates;
+            # only equality matters, so a fast non-MD5 digest is enough
+            canonical = _WS.sub(' ', unicodedata.normalize('NFKC', content).lower()).strip()
+            canonical_hash = hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+            # Preprocess once for all similarity comparisons
+            term_counts = Counter(self.preprocess_text(content).split())
+            norm = math.sqrt(sum(count * count for count in term_counts.values()))
+            topics = set(self.extract_topics(content))
 
             return DocumentInfo(
                 file_path=str(file_path),
@@ -81,7 +163,10 @@ class DocumentationDuplicateDetector:
                 word_count=word_count,
                 size_kb=size_kb,
                 last_modified=last_modified,
-                hash_md5=hash_md5
+                canonical_hash=canonical_hash,
+                term_counts=term_counts,
+                norm=norm,
+                topics=topics
             )
 
         except (UnicodeDecodeError, FileNotFoundError, PermissionError):
@@ -93,32 +178,20 @@ class DocumentationDuplicateDetector:
         text = text.lower()
 
         # Remove markdown syntax
-        text = re.sub(r'[#*`_\[\]()~]', ' ', text)
-        text = re.sub(r'!\[.*?\]\(.*?\)', ' ', text)  # Remove images
-        text = re.sub(r'\[.*?\]\(.*?\)', ' ', text)   # Remove links
+        text = _MD_SYNTAX.sub(' ', text)
+        text = _MD_IMG.sub(' ', text)   # Remove images
+        text = _MD_LINK.sub(' ', text)  # Remove links
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS.sub(' ', text).strip()
 
         return text
 
     def extract_topics(self, text: str, max_topics: int = 10) -> List[str]:
         """Extract main topics from text using keyword frequency"""
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
-            'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when',
-            'where', 'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more',
-            'most', 'other', 'some', 'such', 'only', 'own', 'same', 'so', 'than',
-            'too', 'very', 'just', 'now', 'use', 'used', 'using', 'file', 'files'
-        }
-
-        # Extract words and count frequency
-        words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-        word_freq = Counter(word for word in words if word not in stop_words)
+        # Extract words and count frequency, skipping common stop words
+        words = _TOPIC_WORD.findall(text.lower())
+        word_freq = Counter(word for word in words if word not in _STOP_WORDS)
 
         # Return top topics
         return [word for word, _ in word_freq.most_common(max_topics)]
@@ -129,79 +202,214 @@ class DocumentationDuplicateDetector:
         text1 = self.preprocess_text(text1)
         text2 = self.preprocess_text(text2)
 
-        # Create word frequency dictionaries
-        words1 = text1.split()
-        words2 = text2.split()
-
-        # Get all unique words
-        all_words = set(words1 + words2)
-
-        # Create TF-IDF vectors (simplified - using term frequency only)
-        tf1 = {word: words1.count(word) / len(words1) for word in all_words}
-        tf2 = {word: words2.count(word) / len(words2) for word in all_words}
+        # Create word frequency counts (simplified TF-IDF - term frequency only;
+        # the 1/len normalization cancels out of the cosine)
+        counts1 = Counter(text1.split())
+        counts2 = Counter(text2.split())
 
-        # Calculate cosine similarity
-        dot_product = sum(tf1[word] * tf2[word] for word in all_words)
-        magnitude1 = math.sqrt(sum(tf1[word] ** 2 for word in all_words))
-        magnitude2 = math.sqrt(sum(tf2[word] ** 2 for word in all_words))
+        # Calculate cosine similarity; only shared words contribute to the dot product,
+        # so probe the larger counter from the smaller one without building a key set
+        small, large = (counts1, counts2) if len(counts1) <= len(counts2) else (counts2, counts1)
+        dot_product = sum(count * large[word] for word, count in small.items() if word in large)
+        magnitude1 = math.sqrt(sum(count * count for count in counts1.values()))
+        magnitude2 = math.sqrt(sum(count * count for count in counts2.values()))
 
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
 
         return dot_product / (magnitude1 * magnitude2)
 
+    def calculate_document_similarity(self, doc1: DocumentInfo, doc2: DocumentInfo) -> float:
+        """Cosine similarity of two loaded documents from their precomputed term counts"""
+        if doc1.norm == 0 or doc2.norm == 0:
+            return 0.0
+
+        counts1, counts2 = doc1.term_counts, doc2.term_counts
+        if len(counts1) > len(counts2):
+            counts1, counts2 = counts2, counts1
+
+        dot_product = sum(count * counts2[word] for word, count in counts1.items() if word in counts2)
+        return dot_product / (doc1.norm * doc2.norm)
+
+    def _pair_similarity(self, i: int, j: int) -> float:
+        """Cosine similarity of documents i and j, computed at most once per pair"""
+        key = (i, j)
+        if key not in self._similarities:
+            self._similarities[key] = self.calculate_document_similarity(self.documents[i], self.documents[j])
+        return self._similarities[key]
+
+    def _document_similarity(self, i: int, j: int) -> float:
+        """Cached similarity for any two document indexes (order-insensitive)"""
+        if i == j:
+            return 1.0 if self.documents[i].norm else 0.0
+        return self._pair_similarity(min(i, j), max(i, j))
+
+    def _pivot_similarities(self) -> List[List[float]]:
+        """Build (once) each document's similarities to a set of mutually distant pivots"""
+        if self._pivot_profiles is None:
+            pivots = []
+            if self.documents:
+                # Farthest-first: each new pivot is least similar to the ones already chosen
+                pivots.append(0)
+                while len(pivots) < min(SIMILARITY_PIVOTS, len(self.documents)):
+                    pivots.append(min(
+                        (i for i in range(len(self.documents)) if i not in pivots),
+                        key=lambda i: max(self._document_similarity(i, p) for p in pivots)
+                    ))
+            self._pivot_profiles = [
+                [self._document_similarity(i, p) for p in pivots]
+                for i in range(len(self.documents))
+            ]
+        return self._pivot_profiles
+
+    def _cannot_reach(self, i: int, j: int, threshold: float) -> bool:
+        """True when the pivot bound proves documents i and j are less similar than threshold"""
+        # For unit vectors |cos(a, p) - cos(b, p)| <= ||a - b|| = sqrt(2 - 2 cos(a, b)),
+        # so a larger gap on any pivot rules the pair out (small slack for rounding)
+        radius = math.sqrt(2 * (1 - threshold)) + 1e-9
+        profiles = self._pivot_similarities()
+        return any(abs(a - b) > radius for a, b in zip(profiles[i], profiles[j]))
+
+    def _minhash_signatures(self) -> List[bytes]:
+        """Build (once) a b-bit MinHash fingerprint over each document's vocabulary"""
+        if self._minhashes is None:
+            self._minhashes = []
+            for doc in self.documents:
+                minhash = MinHash(num_perm=MINHASH_PERMUTATIONS)
+                for word in doc.term_counts:
+                    minhash.update(word.encode('utf-8'))
+                # Keep only the low byte of each hash value: 128 bytes per document
+                self._minhashes.append(bytes(int(value) & 0xFF for value in minhash.hashvalues))
+        return self._minhashes
+
+    def _lsh_bands(self, threshold: float) -> Tuple[int, int]:
+        """Band count and rows per band whose collision S-curve crosses closest to threshold"""
+        return min(
+            ((bands, MINHASH_PERMUTATIONS // bands) for bands in range(1, MINHASH_PERMUTATIONS + 1)),
+            key=lambda shape: abs((1 / shape[0]) ** (1 / shape[1]) - threshold)
+        )
+
+    def _words_rarest_first(self) -> List[List[str]]:
+        """Build (once) each document's vocabulary ordered by ascending document frequency"""
+        if self._rarity_orders is None:
+            doc_freq = Counter(word for doc in self.documents for word in doc.term_counts)
+            self._rarity_orders = [
+                sorted(doc.term_counts, key=lambda w: (doc_freq[w], w))
+                for doc in self.documents
+            ]
+        return self._rarity_orders
+
+    def _indexed_candidate_pairs(self, threshold: float) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) that share a word in an inverted index of each document's rarer words"""
+        # Words are ordered rarest first and each document leaves its longest tail of
+        # widespread words unindexed while that tail's length stays below threshold * norm.
+        # If two documents' first shared word is in either tail, every shared word is,
+        # so by Cauchy-Schwarz their similarity is below threshold
+        rarity_orders = self._words_rarest_first()
+
+        # Sweep documents in order of similarity to the first pivot. Partners more than the
+        # pivot radius below the current document cannot reach threshold (see _cannot_reach),
+        # so each postings list is trimmed from the front as the sweep advances
+        radius = math.sqrt(2 * (1 - threshold)) + 1e-9
+        first_pivot = [profile[0] for profile in self._pivot_similarities()]
+        sweep_order = sorted(range(len(self.documents)), key=first_pivot.__getitem__)
+
+        postings = defaultdict(list)
+        starts = defaultdict(int)
+        pairs = []
+        for j in sweep_order:
+            doc = self.documents[j]
+            words = list(rarity_orders[j])
+            budget = (threshold * doc.norm) ** 2 * (1 - 1e-9)
+            unindexed = 0
+            while words and unindexed + doc.term_counts[words[-1]] ** 2 < budget:
+                unindexed += doc.term_counts[words.pop()] ** 2
+
+            # Probe with the indexed words, then add this document to their postings
+            lowest = first_pivot[j] - radius
+            matches = set()
+            for word in words:
+                docs = postings[word]
+                start = starts[word]
+                while start < len(docs) and first_pivot[docs[start]] < lowest:
+                    start += 1
+                starts[word] = start
+                matches.update(docs[start:])
+                docs.append(j)
+            pairs.extend((min(i, j), max(i, j)) for i in matches)
+        return sorted(pairs)
+
+    def _candidate_pairs(self, threshold: float) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) of documents worth an exact similarity check"""
+        if not self.use_lsh:
+            return self._indexed_candidate_pairs(threshold)
+
+        # Approximate: pairs whose vocabularies barely overlap are never compared
+        signatures = self._minhash_signatures()
+        bands, rows = self._lsh_bands(threshold * LSH_THRESHOLD_RATIO)
+
+        pairs = set()
+        for band in range(bands):
+            # Documents sharing a band's bytes land in the same bucket
+            buckets = defaultdict(list)
+            for i, signature in enumerate(signatures):
+                buckets[signature[band * rows:(band + 1) * rows]].append(i)
+            for members in buckets.values():
+                pairs.update(
+                    (members[a], members[b])
+                    for a in range(len(members)) for b in range(a + 1, len(members))
+                )
+        return sorted(pairs)
+
     def find_exact_duplicates(self) -> List[DuplicateResult]:
-        """Find exact duplicates using MD5 hashes"""
+        """Find exact duplicates using canonical content hashes"""
         hash_groups = defaultdict(list)
 
         for doc in self.documents:
             if doc:
-                hash_groups[doc.hash_md5].append(doc)
+                hash_groups[doc.canonical_hash].append(doc)
 
         exact_duplicates = []
         for hash_value, docs in hash_groups.items():
             if len(docs) > 1:
-                # Sort by last modified (newer first)
-                docs.sort(key=lambda x: float(x.last_modified), reverse=True)
-
-                # All files in this group are exact duplicates
-                for i in range(1, len(docs)):
-                    exact_duplicates.append(DuplicateResult(
-                        similarity=1.0,
-                        file1=docs[0].file_path,  # Keep the newest
-                        file2=docs[i].file_path,  # This is a duplicate
-                        duplicate_type='exact'
-                    ))
+                # Keep the most recently modified file
+                newest = max(docs, key=lambda x: x.last_modified)
+
+                # All other files in this group are exact duplicates
+                for doc in docs:
+                    if doc is not newest:
+                        exact_duplicates.append(DuplicateResult(
+                            similarity=1.0,
+                            file1=newest.file_path,  # Keep the newest
+                            file2=doc.file_path,     # This is a duplicate
+                            duplicate_type='exact'
+                        ))
 
         return exact_duplicates
 
     def find_near_duplicates(self) -> List[DuplicateResult]:
         """Find near-duplicates using similarity threshold"""
         near_duplicates = []
-        processed = set()
 
-        for i, doc1 in enumerate(self.documents):
-            if not doc1 or i in processed:
+        for i, j in self._candidate_pairs(self.similarity_threshold):
+            if self._cannot_reach(i, j, self.similarity_threshold):
                 continue
+            doc1, doc2 = self.documents[i], self.documents[j]
 
-            for j, doc2 in enumerate(self.documents[i+1:], i+1):
-                if not doc2 or j in processed:
-                    continue
-
-                # Calculate similarity
-                similarity = self.calculate_cosine_similarity(doc1.content, doc2.content)
+            # Calculate similarity
+            similarity = self._pair_similarity(i, j)
 
-                if similarity >= self.similarity_threshold:
-                    # Find differences
-                    differences = self.find_differences(doc1.content, doc2.content)
+            if similarity >= self.similarity_threshold:
+                # Find differences
+                differences = self.find_differences(doc1.content, doc2.content)
 
-                    near_duplicates.append(DuplicateResult(
-                        similarity=similarity,
-                        file1=doc1.file_path,
-                        file2=doc2.file_path,
-                        duplicate_type='near',
-                        differences=differences
-                    ))
+                near_duplicates.append(DuplicateResult(
+                    similarity=similarity,
+                    file1=doc1.file_path,
+                    file2=doc2.file_path,
+                    duplicate_type='near',
+                    differences=differences
+                ))
 
         return near_duplicates
 
@@ -209,30 +417,25 @@ class DocumentationDuplicateDetector:
         """Find documents with overlapping content but below near-duplicate threshold"""
         overlapping_docs = []
 
-        for i, doc1 in enumerate(self.documents):
-            if not doc1:
+        for i, j in self._candidate_pairs(overlap_threshold):
+            if self._cannot_reach(i, j, overlap_threshold):
                 continue
+            doc1, doc2 = self.documents[i], self.documents[j]
 
-            for j, doc2 in enumerate(self.documents[i+1:], i+1):
-                if not doc2:
-                    continue
-
-                # Calculate similarity
-                similarity = self.calculate_cosine_similarity(doc1.content, doc2.content)
-
-                if overlap_threshold <= similarity < self.similarity_threshold:
-                    # Extract topics
-                    topics1 = self.extract_topics(doc1.content)
-                    topics2 = self.extract_topics(doc2.content)
-                    shared_topics = list(set(topics1) & set(topics2))
-
-                    overlapping_docs.append(DuplicateResult(
-                        similarity=similarity,
-                        file1=doc1.file_path,
-                        file2=doc2.file_path,
-                        duplicate_type='overlap',
-                        shared_topics=shared_topics
-                    ))
+            # Calculate similarity
+            similarity = self._pair_similarity(i, j)
+
+            if overlap_threshold <= similarity < self.similarity_threshold:
+                # Topics were extracted once per document at load time
+                shared_topics = list(doc1.topics & doc2.topics)
+
+                overlapping_docs.append(DuplicateResult(
+                    similarity=similarity,
+                    file1=doc1.file_path,
+                    file2=doc2.file_path,
+                    duplicate_type='overlap',
+                    shared_topics=shared_topics
+                ))
 
         return overlapping_docs
 
@@ -240,33 +443,47 @@ class DocumentationDuplicateDetector:
         """Find key differences between two documents"""
         differences = []
 
-        # Split into lines for comparison
-        lines1 = content1.split('\n')
-        lines2 = content2.split('\n')
-
-        # Find unique lines in each document
-        set1 = set(line.strip() for line in lines1 if line.strip())
-        set2 = set(line.strip() for line in lines2 if line.strip())
+        # Fingerprint each distinct non-empty line as an integer hash
+        hashes1 = self._line_fingerprints(content1)
+        hashes2 = self._line_fingerprints(content2)
 
-        unique1 = set1 - set2
-        unique2 = set2 - set1
+        # Find unique lines in each document by set operations on the fingerprints
+        unique1 = hashes1 - hashes2
+        unique2 = hashes2 - hashes1
 
         if unique1:
             differences.append(f"Unique to file 1: {len(unique1)} lines")
             # Add some examples
-            examples = list(unique1)[:3]
-            for example in examples:
+            for example in self._example_lines(content1, unique1):
                 differences.append(f"  - {example[:50]}...")
 
         if unique2:
             differences.append(f"Unique to file 2: {len(unique2)} lines")
             # Add some examples
-            examples = list(unique2)[:3]
-            for example in examples:
+            for example in self._example_lines(content2, unique2):
                 differences.append(f"  - {example[:50]}...")
 
         return differences
 
+    def _line_fingerprints(self, content: str) -> Set[int]:
+        """Hashes of the stripped, non-empty lines of a document"""
+        return {hash(line) for line in map(str.strip, content.split('\n')) if line}
+
+    def _example_lines(self, content: str, line_hashes: Set[int], limit: int = 3) -> List[str]:
+        """First distinct lines (in document order) whose hashes are in line_hashes"""
+        examples = []
+        seen = set()
+        for line in map(str.strip, content.split('\n')):
+            if not line:
+                continue
+            line_hash = hash(line)
+            if line_hash in line_hashes and line_hash not in seen:
+                seen.add(line_hash)
+                examples.append(line)
+                if len(examples) == limit:
+                    break
+        return examples
+
     def analyze_duplicates(self) -> Dict:
         """Main analysis method"""
         print("🔍 Detecting duplicate documentation...")
@@ -276,10 +493,14 @@ class DocumentationDuplicateDetector:
         print(f"📚 Found {len(doc_files)} documentation files")
 
         print("📖 Loading documents...")
-        for doc_file in doc_files:
-            doc = self.load_document(doc_file)
-            if doc:
-                self.documents.append(doc)
+        # Reading, hashing and preprocessing are independent per file
+        if len(doc_files) > PARALLEL_LOAD_THRESHOLD:
+            paths, stats = zip(*doc_files)
+            with ProcessPoolExecutor() as executor:
+                loaded = list(executor.map(self.load_document, paths, stats, chunksize=16))
+        else:
+            loaded = [self.load_document(path, stat) for path, stat in doc_files]
+        self.documents.extend(doc for doc in loaded if doc)
 
         print(f"✅ Loaded {len(self.documents)} documents successfully")
 
@@ -369,18 +590,25 @@ def main():
     parser.add_argument('--threshold', type=float, default=0.90, help='Similarity threshold for near duplicates')
     parser.add_argument('--output', help='Output JSON file path')
     parser.add_argument('--pretty', action='store_true', help='Pretty print JSON output')
+    parser.add_argument('--lsh', action='store_true',
+                        help='Only compare MinHash-LSH candidate pairs (faster on large corpora, may miss overlaps; needs datasketch)')
 
     args = parser.parse_args()
 
-    detector = DocumentationDuplicateDetector(args.docs_dir, args.threshold)
+    detector = DocumentationDuplicateDetector(args.docs_dir, args.threshold, use_lsh=args.lsh)
     result = detector.analyze_duplicates()
 
+    if orjson is not None:
+        data = orjson.dumps(result, option=orjson.OPT_INDENT_2 if args.pretty else 0)
+    else:
+        data = json.dumps(result, indent=2 if args.pretty else None).encode('utf-8')
+
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2 if args.pretty else None)
+        Path(args.output).write_bytes(data)
         print(f"✅ Results saved to: {args.output}")
     else:
-        print(json.dumps(result, indent=2 if args.pretty else None))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b'\n')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
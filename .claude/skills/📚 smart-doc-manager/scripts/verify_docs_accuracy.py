@@ -11,13 +11,86 @@ Compares documentation claims against actual code implementation to detect:
 
 import os
 import re
+import sys
 import json
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from collections import defaultdict
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON output, stdlib json otherwise
+    orjson = None
+
+# Per-language feature patterns, one alternation per line; each group is named
+# after the features key it fills
+_JS_FEATURES = re.compile(
+    r'(?P<imports>(?:import|const)\s+.*from\s+[\'"][^\'"]+[\'"])'
+    r'|(?P<functions>export\s+(?:function|const)\s+\w+)'
+    r'|(?P<endpoints>\w+\.(?:get|post|put|delete|patch)\s*\([\'"][^\'"]+[\'"])'
+    r'|(?P<classes>export\s+class\s+\w+)'
+)
+_PY_FEATURES = re.compile(
+    r'(?P<imports>(?:import|from)\s+[a-zA-Z_][a-zA-Z0-9_.]*)'
+    r'|(?P<functions>def\s+\w+)'
+    r'|(?P<classes>class\s+\w+)'
+    r'|(?P<endpoints>@\w+\.(?:route|get|post|put|delete)\s*\([\'"][^\'"]+[\'"])'
+)
+_FEATURE_PATTERNS = {
+    '.ts': _JS_FEATURES, '.tsx': _JS_FEATURES, '.js': _JS_FEATURES, '.jsx': _JS_FEATURES,
+    '.py': _PY_FEATURES,
+}
+_FEATURE_EVIDENCE_TYPES = {
+    'imports': 'import',
+    'functions': 'function',
+    'classes': 'class',
+    'endpoints': 'endpoint',
+}
+
+# Database operations (common patterns)
+_DB_OPERATION = re.compile(
+    r'SELECT\s+.*FROM\s+(\w+)'
+    r'|INSERT\s+INTO\s+(\w+)'
+    r'|UPDATE\s+(\w+)\s+SET'
+    r'|DELETE\s+FROM\s+(\w+)'
+    r'|CREATE\s+TABLE\s+(\w+)'
+    r'|DROP\s+TABLE\s+(\w+)',
+    re.IGNORECASE
+)
+_CONFIG_KEY = re.compile(r'^[\'"]?([a-zA-Z_][a-zA-Z0-9_]*)[\'"]?\s*[:=]')
+
+# Names pulled back out of code evidence lines
+_FUNCTION_NAME = re.compile(r'(?:function|def)\s+(\w+)')
+_CLASS_NAME = re.compile(r'class\s+(\w+)')
+_ENDPOINT_PATH = re.compile(r'[\'"]/([^\'"]+)[\'"]')
+
+# Patterns to identify feature claims in documentation
+_CLAIM_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), claim_type, confidence)
+    for pattern, claim_type, confidence in [
+        # API endpoints
+        (r'([A-Z]+\s+[/][^ \n]+)', 'api_endpoint', 90),
+        (r'(?:endpoint|route):\s*([A-Z]+\s+[/][^ \n]+)', 'api_endpoint', 85),
+
+        # Database tables
+        (r'(?:table|collection):\s*(\w+)', 'database_table', 80),
+        (r'(?:CREATE|DROP|ALTER)\s+TABLE\s+(\w+)', 'database_table', 95),
+
+        # Technologies and libraries
+        (r'(?:built with|uses|powered by|requires)\s+([A-Z][a-zA-Z0-9\s-]+)', 'technology', 70),
+        (r'([A-Z][a-zA-Z0-9]+)\s+(?:library|framework|package)', 'technology', 75),
+
+        # Features and functionality
+        (r'(?:supports|provides|offers|includes)\s+(\w+(?:\s+\w+)*)', 'feature', 60),
+        (r'(\w+(?:\s+\w+)*)\s+(?:feature|functionality|capability)', 'feature', 65),
+    ]
+]
+
+_FENCED_BLOCK = re.compile(r'```(\w*)\n(.*?)\n```', re.DOTALL)
+
 class FeatureStatus(Enum):
     ACTIVE = "ACTIVE"
     DOCUMENTATION_ONLY = "DOCUMENTATION_ONLY"
@@ -102,92 +175,32 @@ class DocumentationAccuracyVerifier:
         except (UnicodeDecodeError, PermissionError):
             return features
 
-        ext = source_file.suffix.lower()
+        file_path = str(source_file)
+        feature_pattern = _FEATURE_PATTERNS.get(source_file.suffix.lower())
 
         for i, line in enumerate(lines, 1):
             line = line.strip()
 
-            # Extract imports
-            if ext in ['.ts', '.tsx', '.js', '.jsx']:
-                # TypeScript/JavaScript imports
-                import_match = re.match(r'^(?:import|const)\s+.*from\s+[\'"]([^\'"]+)[\'"]', line)
-                if import_match:
-                    features['imports'].append(FeatureEvidence(
-                        str(source_file), i, line, 'import'
-                    ))
-
-                # Function exports
-                func_match = re.match(r'^export\s+(?:function|const)\s+(\w+)', line)
-                if func_match:
-                    features['functions'].append(FeatureEvidence(
-                        str(source_file), i, line, 'function'
-                    ))
-
-                # API endpoints
-                endpoint_match = re.match(r'^\w+\.(get|post|put|delete|patch)\s*\([\'"]([^\'"]+)[\'"]', line)
-                if endpoint_match:
-                    features['endpoints'].append(FeatureEvidence(
-                        str(source_file), i, line, 'endpoint'
-                    ))
-
-                # Classes
-                class_match = re.match(r'^export\s+class\s+(\w+)', line)
-                if class_match:
-                    features['classes'].append(FeatureEvidence(
-                        str(source_file), i, line, 'class'
-                    ))
-
-            elif ext == '.py':
-                # Python imports
-                import_match = re.match(r'^(?:import|from)\s+([a-zA-Z_][a-zA-Z0-9_.]*)', line)
-                if import_match:
-                    features['imports'].append(FeatureEvidence(
-                        str(source_file), i, line, 'import'
-                    ))
-
-                # Function definitions
-                func_match = re.match(r'^def\s+(\w+)', line)
-                if func_match:
-                    features['functions'].append(FeatureEvidence(
-                        str(source_file), i, line, 'function'
-                    ))
-
-                # Class definitions
-                class_match = re.match(r'^class\s+(\w+)', line)
-                if class_match:
-                    features['classes'].append(FeatureEvidence(
-                        str(source_file), i, line, 'class'
-                    ))
-
-                # Flask/FastAPI routes
-                route_match = re.match(r'^@\w+\.(?:route|get|post|put|delete)\s*\([\'"]([^\'"]+)[\'"]', line)
-                if route_match:
-                    features['endpoints'].append(FeatureEvidence(
-                        str(source_file), i, line, 'endpoint'
+            # Imports, functions, classes and endpoints: at most one matches a line
+            if feature_pattern:
+                feature_match = feature_pattern.match(line)
+                if feature_match:
+                    kind = feature_match.lastgroup
+                    features[kind].append(FeatureEvidence(
+                        file_path, i, line, _FEATURE_EVIDENCE_TYPES[kind]
                     ))
 
             # Database operations (common patterns)
-            db_patterns = [
-                r'SELECT\s+.*FROM\s+(\w+)',
-                r'INSERT\s+INTO\s+(\w+)',
-                r'UPDATE\s+(\w+)\s+SET',
-                r'DELETE\s+FROM\s+(\w+)',
-                r'CREATE\s+TABLE\s+(\w+)',
-                r'DROP\s+TABLE\s+(\w+)'
-            ]
-
-            for pattern in db_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    features['database_operations'].append(FeatureEvidence(
-                        str(source_file), i, line, 'database_operation'
-                    ))
-                    break
+            if _DB_OPERATION.search(line):
+                features['database_operations'].append(FeatureEvidence(
+                    file_path, i, line, 'database_operation'
+                ))
 
             # Configuration keys
-            config_match = re.match(r'^[\'"]?([a-zA-Z_][a-zA-Z0-9_]*)[\'"]?\s*[:=]', line)
+            config_match = _CONFIG_KEY.match(line)
             if config_match and any(keyword in line.lower() for keyword in ['config', 'setting', 'env', 'database', 'api']):
                 features['config_keys'].append(FeatureEvidence(
-                    str(source_file), i, line, 'config'
+                    file_path, i, line, 'config'
                 ))
 
         return features
@@ -202,25 +215,6 @@ class DocumentationAccuracyVerifier:
         except (UnicodeDecodeError, FileNotFoundError):
             return claims
 
-        # Patterns to identify feature claims
-        claim_patterns = [
-            # API endpoints
-            (r'([A-Z]+\s+[/][^ \n]+)', 'api_endpoint', 90),
-            (r'(?:endpoint|route):\s*([A-Z]+\s+[/][^ \n]+)', 'api_endpoint', 85),
-
-            # Database tables
-            (r'(?:table|collection):\s*(\w+)', 'database_table', 80),
-            (r'(?:CREATE|DROP|ALTER)\s+TABLE\s+(\w+)', 'database_table', 95),
-
-            # Technologies and libraries
-            (r'(?:built with|uses|powered by|requires)\s+([A-Z][a-zA-Z0-9\s-]+)', 'technology', 70),
-            (r'([A-Z][a-zA-Z0-9]+)\s+(?:library|framework|package)', 'technology', 75),
-
-            # Features and functionality
-            (r'(?:supports|provides|offers|includes)\s+(\w+(?:\s+\w+)*)', 'feature', 60),
-            (r'(\w+(?:\s+\w+)*)\s+(?:feature|functionality|capability)', 'feature', 65),
-        ]
-
         for i, line in enumerate(lines, 1):
             line = line.strip()
 
@@ -228,8 +222,8 @@ class DocumentationAccuracyVerifier:
             if not line or line.startswith('#') or line.startswith('//'):
                 continue
 
-            for pattern, claim_type, confidence in claim_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern, claim_type, confidence in _CLAIM_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     claim = DocumentationClaim(
                         doc_file=str(doc_file),
@@ -303,7 +297,7 @@ class DocumentationAccuracyVerifier:
         code_blocks = []
 
         # Fenced code blocks ```
-        fenced_blocks = re.findall(r'```(\w*)\n(.*?)\n```', content, re.DOTALL)
+        fenced_blocks = _FENCED_BLOCK.findall(content)
         for language, code in fenced_blocks:
             code_blocks.append({
                 'type': 'fenced',
@@ -312,21 +306,31 @@ class DocumentationAccuracyVerifier:
                 'line_number': content[:content.find(code)].count('\n') + 1
             })
 
-        # Indented code blocks (4+ spaces)
-        indented_lines = []
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if line.startswith('    ') or line.startswith('\t'):
-                indented_lines.append((i+1, line))
-
-        if indented_lines:
+        # Indented code blocks (4+ spaces): one block per contiguous run of
+        # indented lines, ignoring lines inside fenced blocks
+        def add_indented_block(run):
             code_blocks.append({
                 'type': 'indented',
                 'language': 'text',
-                'code': '\n'.join(line for _, line in indented_lines),
-                'line_number': indented_lines[0][0]
+                'code': '\n'.join(line for _, line in run),
+                'line_number': run[0][0]
             })
 
+        indented_run = []
+        in_fence = False
+        for i, line in enumerate(content.split('\n'), 1):
+            if line.startswith('```'):
+                in_fence = not in_fence
+            elif not in_fence and line.startswith(('    ', '\t')):
+                indented_run.append((i, line))
+                continue
+            if indented_run:
+                add_indented_block(indented_run)
+                indented_run = []
+
+        if indented_run:
+            add_indented_block(indented_run)
+
         verified_blocks = []
         for block in code_blocks:
             # Basic syntax checks
@@ -408,28 +412,25 @@ class DocumentationAccuracyVerifier:
         print("🔍 Checking for undocumented features...")
         documented_features = set(self.verified_features.keys())
 
-        # Extract feature names from code
-        code_feature_names = set()
+        # Extract feature names from code, indexing the lines that define them
+        evidence_by_name = defaultdict(list)
         for feature_type, features in all_code_features.items():
             for feature in features:
                 # Extract meaningful names from evidence
+                name_match = None
                 if feature.evidence_type == 'function':
-                    func_match = re.search(r'(?:function|def)\s+(\w+)', feature.content)
-                    if func_match:
-                        code_feature_names.add(func_match.group(1))
+                    name_match = _FUNCTION_NAME.search(feature.content)
                 elif feature.evidence_type == 'class':
-                    class_match = re.search(r'class\s+(\w+)', feature.content)
-                    if class_match:
-                        code_feature_names.add(class_match.group(1))
+                    name_match = _CLASS_NAME.search(feature.content)
                 elif feature.evidence_type == 'endpoint':
-                    endpoint_match = re.search(r'[\'"]/([^\'"]+)[\'"]', feature.content)
-                    if endpoint_match:
-                        code_feature_names.add(endpoint_match.group(1))
+                    name_match = _ENDPOINT_PATH.search(feature.content)
+                if name_match:
+                    evidence_by_name[name_match.group(1)].append(feature)
 
-        undocumented = code_feature_names - documented_features
+        undocumented = set(evidence_by_name) - documented_features
         for feature in undocumented:
-            # Find evidence for this undocumented feature
-            evidence = self.search_code_for_feature(feature, source_files)
+            # Evidence for this undocumented feature comes from the index, not a rescan
+            evidence = evidence_by_name[feature]
             if evidence:
                 self.undocumented_features.append({
                     'feature_name': feature,
@@ -482,12 +483,18 @@ def main():
     verifier = DocumentationAccuracyVerifier(args.project_root, args.docs_dir)
     result = verifier.verify_accuracy()
 
+    # Unmatched claims hold DocumentationClaim dataclasses; orjson serializes them natively
+    if orjson is not None:
+        data = orjson.dumps(result, option=orjson.OPT_INDENT_2 if args.pretty else 0)
+    else:
+        data = json.dumps(result, indent=2 if args.pretty else None, default=asdict).encode('utf-8')
+
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2 if args.pretty else None)
+        Path(args.output).write_bytes(data)
         print(f"✅ Results saved to: {args.output}")
     else:
-        print(json.dumps(result, indent=2 if args.pretty else None))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b'\n')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,14 +9,194 @@ import sys
 import json
 import csv
 import re
+import mmap
+import hashlib
+import sqlite3
 import subprocess
 from pathlib import Path
+from stat import S_ISREG
 from typing import Dict, List, Set, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain, repeat
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import yaml
 import git
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON output, stdlib json otherwise
+    orjson = None
+
+# Author line in a component's file header
+_AUTHOR_HEADER = re.compile(r'@author\s+(.+)|Author:\s+(.+)')
+
+# Rest of a line from an import keyword onwards
+_IMPORT_LINE = re.compile(rb'\bimport\b[^\n]*')
+
+# Minimum number of files before analysis fans out to worker processes
+PARALLEL_ANALYSIS_THRESHOLD = 64
+PARALLEL_CHUNK_SIZE = 32
+
+# Larger files, and script files whose first block holds almost no line breaks, are
+# bundles or minified output rather than hand-written components
+MAX_COMPONENT_FILE_SIZE = 512 * 1024
+MINIFIED_PROBE_SIZE = 4096
+
+# Files at least this large are hashed from a memory map instead of a copied read
+MMAP_HASH_THRESHOLD = 64 * 1024
+
+# Framework and metadata of analyzed files, keyed by path and content hash; bump the
+# version whenever the handlers change what they extract
+ANALYSIS_CACHE_PATH = Path.home() / '.cache' / 'storybook-master' / 'discovery.sqlite'
+ANALYSIS_CACHE_VERSION = b'4'
+
+# Sort rank of each priority, most urgent first
+_PRIORITY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+# Files with these words in their name are tests, fixtures or demos rather than components
+_TEST_NAME_INDICATORS = ('test', 'spec', 'mock', 'fixture', 'example')
+
+
+@lru_cache(maxsize=4096)
+def _lowercase_path(file_path: Path) -> Tuple[str, Tuple[str, ...]]:
+    """Lowercased stem and parts of a path, shared by the discovery and classification checks"""
+    return file_path.stem.lower(), tuple(part.lower() for part in file_path.parts)
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob where '**' spans directories and '*'/'?' stay within one"""
+    wildcards = {'**': '.*', '*': '[^/]*', '?': '[^/]'}
+    return ''.join(wildcards.get(part, re.escape(part))
+                   for part in re.split(r'(\*\*|\*|\?)', pattern))
+
+
+def _compile_ignore_matcher(ignore_patterns: Tuple[str, ...]) -> re.Pattern:
+    """Combine every ignore rule into one regex searched against a project-relative path"""
+    alternatives = []
+    for pattern in ignore_patterns:
+        if '*' in pattern or '?' in pattern:
+            # Globs match whole path segments at any depth
+            alternatives.append(r'(?:^|/)' + _glob_to_regex(pattern) + r'(?:/|$)')
+        else:
+            # Plain patterns keep their substring semantics
+            alternatives.append(re.escape(pattern))
+    alternatives.append(r'(?i:(?:' + '|'.join(_TEST_NAME_INDICATORS) + r')[^/]*$)')
+    return re.compile('|'.join(alternatives))
+
+
+@lru_cache(maxsize=4096)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file's text; mtime and size are part of the cache key only"""
+    # One bulk read and decode instead of the incremental text I/O stack
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8', errors='replace')
+
+    # Keep the universal-newline translation text mode did
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a file's text at most once per run while it is unchanged"""
+    stat = file_path.stat()
+    return _read_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _compile_atomic_type_matcher(rules: List[Tuple[str, List[str], List[str]]]) -> re.Pattern:
+    """Combine atomic design rules into one regex whose matching group names the type.
+
+    The subject is '/<lowercased path parts>/' + NUL + lowercased stem. Each type is a
+    lookahead tried in rule order, so earlier types win as with sequential checks.
+    """
+    branches = []
+    for atomic_type, directories, name_fragments in rules:
+        alternatives = [r'[^\0]*/(?:' + '|'.join(map(re.escape, directories)) + ')/']
+        if name_fragments:
+            alternatives.append(r'[^\0]*\0.*?(?:' + '|'.join(map(re.escape, name_fragments)) + ')')
+        branches.append(f'(?=(?P<{atomic_type}>' + '|'.join(alternatives) + '))')
+    return re.compile('(?:' + '|'.join(branches) + ')')
+
+
+def _detect_framework(file_path: Path) -> str:
+    """Detect which framework a component uses"""
+    extension = file_path.suffix
+
+    if extension in ['.tsx', '.jsx']:
+        return 'react'
+    elif extension == '.vue':
+        return 'vue'
+    elif extension == '.svelte':
+        return 'svelte'
+    elif extension in ['.ts', '.js']:
+        # Check content for framework indicators
+        try:
+            content = _read_text(file_path)[:1000]  # First 1KB
+
+            if 'Vue' in content or '@vue' in content:
+                return 'vue'
+            elif 'React' in content or 'ReactComponent' in content:
+                return 'react'
+            elif 'customElements' in content or 'HTMLElement' in content:
+                return 'web-components'
+            else:
+                return 'react'  # Default assumption
+        except Exception:
+            return 'react'  # Default assumption
+
+    return 'unknown'
+
+
+def _extract_component_analysis(file_path: Path, project_root: Path,
+                                framework_handlers: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Detect a file's framework and extract its metadata (module-level so worker processes can run it)"""
+    try:
+        framework = _detect_framework(file_path)
+
+        # Get framework handler
+        handler = framework_handlers.get(framework)
+        if not handler:
+            return None
+
+        return {'framework': framework, 'metadata': handler.extract_metadata(file_path, project_root)}
+
+    except Exception as e:
+        print(f"  Error analyzing {file_path}: {e}")
+        return None
+
+
+def _count_usages_in_files(file_paths: List[Path], usage_patterns: Tuple) -> List[Counter]:
+    """Tally component-name usages in each file (module-level so worker processes can run it)"""
+    jsx_usage, create_element_usage, name_usage = usage_patterns
+    results = []
+
+    for file_path in file_paths:
+        counts = Counter()
+        try:
+            # Scan the mapped bytes directly; empty files cannot be mapped and hold no usages
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        # JSX and React.createElement usage
+                        counts.update(match.group(1) for match in jsx_usage.finditer(content))
+                        counts.update(match.group(1) for match in create_element_usage.finditer(content))
+
+                        # Import usage (once per file)
+                        counts.update({
+                            match.group(1)
+                            for import_line in _IMPORT_LINE.findall(content)
+                            for match in name_usage.finditer(import_line)
+                        })
+        except Exception:
+            pass
+
+        results.append(Counter({name.decode(): count for name, count in counts.items()}))
+
+    return results
+
 @dataclass
 class ComponentInfo:
     """Represents a discovered UI component"""
@@ -26,7 +206,7 @@ class ComponentInfo:
     file_type: str
     has_story: bool
     story_path: Optional[str]
-    last_modified: datetime
+    last_modified: float  # st_mtime; formatted only when written out
     file_size: int
     props_count: int
     events_count: int
@@ -37,8 +217,48 @@ class ComponentInfo:
     atomic_type: Optional[str]  # atom, molecule, organism, template, page
     design_link: Optional[str]
     metadata: Dict[str, Any]
+    story_outdated: bool = False  # Set once discovery is complete
 
 class ComponentDiscovery:
+    # File types a component can live in
+    COMPONENT_EXTENSIONS = frozenset(['.tsx', '.jsx', '.vue', '.svelte', '.ts', '.js'])
+
+    # Filename fragments (lowercased once) that mark a UI component rather than a utility file
+    UI_INDICATORS = tuple(dict.fromkeys(indicator.lower() for indicator in [
+        'Component', 'component',
+        'Button', 'Input', 'Modal', 'Card', 'Layout', 'Header', 'Footer',
+        'Nav', 'Sidebar', 'Form', 'Table', 'List', 'Grid', 'Container',
+        'Popup', 'Dialog', 'Tooltip', 'Dropdown', 'Menu', 'Tabs', 'Accordion'
+    ]))
+
+    # Single-file component formats: the extension alone identifies a component
+    SFC_EXTENSIONS = frozenset(['.vue', '.svelte'])
+
+    # Directories whose files are taken to be components without reading them
+    UI_DIRECTORIES = frozenset(['components', 'ui'])
+
+    # Atomic design levels in priority order: (type, directory names, filename fragments)
+    ATOMIC_DESIGN_RULES = [
+        # Atoms (smallest indivisible elements)
+        ('atom', ['atoms', 'atom', 'elements', 'base'],
+         ['button', 'input', 'label', 'icon', 'avatar', 'badge']),
+        # Molecules (simple groups of atoms)
+        ('molecule', ['molecules', 'molecule'],
+         ['form', 'card', 'modal', 'tooltip', 'dropdown', 'search']),
+        # Organisms (complex UI sections)
+        ('organism', ['organisms', 'organism'],
+         ['header', 'footer', 'sidebar', 'navbar', 'layout', 'table']),
+        # Templates (page layouts)
+        ('template', ['templates', 'template', 'layouts', 'layout'],
+         ['page', 'template', 'layout']),
+        # Pages (specific instances)
+        ('page', ['pages', 'page', 'views', 'view'], []),
+    ]
+    ATOMIC_TYPE_MATCHER = _compile_atomic_type_matcher(ATOMIC_DESIGN_RULES)
+
+    # File types scanned for component usages
+    SOURCE_EXTENSIONS = frozenset(['.tsx', '.jsx', '.vue', '.ts', '.js'])
+
     def __init__(self, config_path: str = None):
         self.project_root = Path.cwd()
         self.config = self._load_config(config_path)
@@ -49,6 +269,9 @@ class ComponentDiscovery:
             'svelte': SvelteComponentHandler(),
             'web-components': WebComponentHandler()
         }
+        self._ignore_matcher = None
+        self._author_by_path = {}
+        self._source_files = None
 
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from file"""
@@ -104,117 +327,218 @@ class ComponentDiscovery:
         # Discover component files
         component_files = self._find_component_files()
         print(f"Found {len(component_files)} potential component files")
-
-        # Process each component file
-        for file_path in component_files:
-            try:
-                component = self._analyze_component_file(file_path)
-                if component:
-                    self.components.append(component)
-            except Exception as e:
-                print(f"  Error analyzing {file_path}: {e}")
+        self._author_by_path = self._load_code_owners(component_files)
+
+        # Files unchanged since a previous run skip framework detection and metadata extraction
+        cache = self._open_analysis_cache()
+        content_hashes = [self._content_hash(file_path) for file_path in component_files]
+        cached_analyses = [self._load_cached_analysis(cache, file_path, content_hash)
+                           for file_path, content_hash in zip(component_files, content_hashes)]
+
+        # Framework detection and metadata extraction are CPU-bound and independent per
+        # file, so cache misses fan out to worker processes; only paths and plain dicts
+        # cross the process boundary
+        misses = [file_path for file_path, cached_analysis in zip(component_files, cached_analyses)
+                  if cached_analysis is None]
+        if len(misses) > PARALLEL_ANALYSIS_THRESHOLD:
+            with ProcessPoolExecutor() as executor:
+                fresh_analyses = list(executor.map(_extract_component_analysis, misses,
+                                                   repeat(self.project_root), repeat(self.framework_handlers),
+                                                   chunksize=PARALLEL_CHUNK_SIZE))
+        else:
+            fresh_analyses = [_extract_component_analysis(file_path, self.project_root, self.framework_handlers)
+                              for file_path in misses]
+        fresh = iter(fresh_analyses)
+        analyses = [cached_analysis if cached_analysis is not None else next(fresh)
+                    for cached_analysis in cached_analyses]
+
+        # Story lookup, stat, owner and atomic type stay in this process
+        analyzed = [self._analyze_component_file(file_path, analysis)
+                    for file_path, analysis in zip(component_files, analyses)]
+        self.components.extend(component for component in analyzed if component)
+
+        self._store_analyses(cache, component_files, content_hashes, cached_analyses, analyzed)
 
         # Analyze usage and update metadata
+        self._source_files = self._find_source_files()
         self._analyze_component_usage()
         self._assign_priorities()
         self._classify_atomic_types()
 
+        # Reports read this flag instead of each re-checking the story files
+        for component in self.components:
+            component.story_outdated = self._is_story_outdated(component)
+
         print(f"✅ Discovered {len(self.components)} components")
         return self.components
 
     def _find_component_files(self) -> List[Path]:
         """Find all potential component files"""
-        component_files = []
+        # Keyed by path string: dedupes overlapping patterns in discovery order, and a
+        # path matched by an earlier pattern is not checked again
+        component_files = {}
 
         for pattern in self.config['discovery']['component_paths']:
             try:
-                files = self.project_root.glob(pattern)
-                for file_path in files:
-                    if file_path.is_file() and self._is_component_file(file_path):
-                        if not self._should_ignore_file(file_path):
-                            component_files.append(file_path)
+                for file_path in self.project_root.glob(pattern):
+                    file_str = str(file_path)
+                    if file_str in component_files or self._should_ignore_file(file_path):
+                        continue
+                    if self._is_component_file(file_path) and self._looks_hand_written(file_path):
+                        component_files[file_str] = file_path
             except Exception as e:
                 print(f"  Error processing pattern {pattern}: {e}")
 
-        return list(set(component_files))  # Remove duplicates
+        return list(component_files.values())
+
+    def _find_source_files(self) -> List[Path]:
+        """Find all source files that may use components, in one walk of the project"""
+        source_files = []
+        for dirpath, _, filenames in os.walk(self.project_root):
+            for filename in filenames:
+                if os.path.splitext(filename)[1] in self.SOURCE_EXTENSIONS:
+                    file_path = Path(dirpath, filename)
+                    if not self._should_ignore_file(file_path):
+                        source_files.append(file_path)
+
+        return source_files
 
     def _is_component_file(self, file_path: Path) -> bool:
         """Determine if a file is likely a UI component"""
-        extensions = ['.tsx', '.jsx', '.vue', '.svelte', '.ts', '.js']
-
-        if file_path.suffix not in extensions:
+        if file_path.suffix not in self.COMPONENT_EXTENSIONS:
             return False
+        if file_path.suffix in self.SFC_EXTENSIONS:
+            return True
 
-        # Check if it's likely a UI component vs utility file
-        ui_indicators = [
-            'Component', 'component',
-            'Button', 'Input', 'Modal', 'Card', 'Layout', 'Header', 'Footer',
-            'Nav', 'Sidebar', 'Form', 'Table', 'List', 'Grid', 'Container',
-            'Popup', 'Dialog', 'Tooltip', 'Dropdown', 'Menu', 'Tabs', 'Accordion'
-        ]
-
-        filename = file_path.stem
-        filename_lower = filename.lower()
-
-        # Check filename for UI indicators
-        if any(indicator.lower() in filename_lower for indicator in ui_indicators):
+        # Filename and directory checks decide most files before any read
+        stem_lower, parts_lower = _lowercase_path(file_path)
+        if any(indicator in stem_lower for indicator in self.UI_INDICATORS):
             return True
 
-        # Check directory structure
-        parent_dirs = [part.lower() for part in file_path.parts]
-        if 'components' in parent_dirs or 'ui' in parent_dirs:
+        if not self.UI_DIRECTORIES.isdisjoint(parts_lower):
             return True
 
-        # Check file content for React/Vue exports
+        # Check the first 2KB of script files for component exports; a raw read
+        # skips the text I/O stack for what is only a probe
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read(2000)  # Read first 2KB
-
-            # Look for component exports
-            if file_path.suffix in ['.tsx', '.jsx', '.ts', '.js']:
-                return (
-                    'export default' in content and
-                    ('React' in content or 'Component' in content or '<' in content and '>' in content)
-                )
-            elif file_path.suffix == '.vue':
-                return '<template>' in content and '<script>' in content
-            elif file_path.suffix == '.svelte':
-                return '<script>' in content and ('<' in content and '>' in content)
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                content = os.read(fd, 2048).decode('utf-8', 'ignore')
+            finally:
+                os.close(fd)
 
-        except Exception:
+            return (
+                'export default' in content and
+                ('React' in content or 'Component' in content or '<' in content and '>' in content)
+            )
+
+        except OSError:
             pass
 
         return False
 
+    def _looks_hand_written(self, file_path: Path) -> bool:
+        """Check that a file is a regular file small and line-structured enough to be hand-written"""
+        try:
+            stat = file_path.stat()
+            if not S_ISREG(stat.st_mode) or stat.st_size > MAX_COMPONENT_FILE_SIZE:
+                return False
+            if file_path.suffix in self.SFC_EXTENSIONS or stat.st_size < MINIFIED_PROBE_SIZE:
+                return True
+
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                head = os.read(fd, MINIFIED_PROBE_SIZE)
+            finally:
+                os.close(fd)
+        except OSError:
+            return False
+
+        return head.count(b'\n') >= 2
+
     def _should_ignore_file(self, file_path: Path) -> bool:
         """Check if file should be ignored based on patterns"""
-        ignore_patterns = self.config['discovery']['ignore_patterns']
-        file_str = str(file_path)
+        ignore_patterns = tuple(self.config['discovery']['ignore_patterns'])
+        # Recompile only when the configured patterns change
+        if self._ignore_matcher is None or self._ignore_matcher[0] != ignore_patterns:
+            self._ignore_matcher = (ignore_patterns, _compile_ignore_matcher(ignore_patterns))
 
-        for pattern in ignore_patterns:
-            if pattern in file_str or file_path.match(pattern):
-                return True
+        try:
+            relative_path = file_path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            relative_path = file_path.as_posix()
 
-        # Ignore files with test indicators in name
-        test_indicators = ['test', 'spec', 'mock', 'fixture', 'example']
-        if any(indicator in file_path.name.lower() for indicator in test_indicators):
-            return True
+        return self._ignore_matcher[1].search(relative_path) is not None
 
-        return False
+    def _open_analysis_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the on-disk analysis cache, or None if it is unavailable"""
+        try:
+            ANALYSIS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            cache = sqlite3.connect(str(ANALYSIS_CACHE_PATH))
+            cache.execute('CREATE TABLE IF NOT EXISTS comp(path TEXT PRIMARY KEY, sha TEXT, json TEXT)')
+            return cache
+        except (OSError, sqlite3.Error) as e:
+            print(f"  Analysis cache unavailable: {e}")
+            return None
+
+    def _content_hash(self, file_path: Path) -> Optional[str]:
+        """Hash a file's content together with the analysis cache version"""
+        digest = hashlib.sha256(ANALYSIS_CACHE_VERSION)
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+                    # Large files are hashed straight from the page cache without a copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        digest.update(content)
+                else:
+                    digest.update(f.read())
+        except (OSError, ValueError):
+            return None
+
+        return digest.hexdigest()
+
+    def _load_cached_analysis(self, cache: Optional[sqlite3.Connection], file_path: Path,
+                              content_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached framework and metadata for unchanged file content"""
+        if cache is None or content_hash is None:
+            return None
 
-    def _analyze_component_file(self, file_path: Path) -> Optional[ComponentInfo]:
-        """Analyze a component file and extract metadata"""
         try:
-            # Determine framework
-            framework = self._detect_framework(file_path)
+            row = cache.execute('SELECT json FROM comp WHERE path = ? AND sha = ?',
+                                (str(file_path), content_hash)).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def _store_analyses(self, cache: Optional[sqlite3.Connection], component_files: List[Path],
+                        content_hashes: List[Optional[str]], cached_analyses: List[Optional[Dict[str, Any]]],
+                        analyzed: List[Optional[ComponentInfo]]):
+        """Write newly analyzed files to the cache, replacing rows for older content"""
+        if cache is None:
+            return
 
-            # Get framework handler
-            handler = self.framework_handlers.get(framework)
-            if not handler:
-                return None
+        try:
+            with cache:
+                for file_path, content_hash, cached_analysis, component in zip(
+                        component_files, content_hashes, cached_analyses, analyzed):
+                    if component and content_hash and cached_analysis is None:
+                        analysis = {'framework': component.framework, 'metadata': component.metadata}
+                        cache.execute('INSERT OR REPLACE INTO comp (path, sha, json) VALUES (?, ?, ?)',
+                                      (str(file_path), content_hash, json.dumps(analysis)))
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"  Could not update analysis cache: {e}")
+        finally:
+            cache.close()
+
+    def _analyze_component_file(self, file_path: Path,
+                                analysis: Optional[Dict[str, Any]]) -> Optional[ComponentInfo]:
+        """Build a component's info from its framework analysis and file metadata"""
+        if analysis is None:
+            return None
 
-            # Extract component information
-            metadata = handler.extract_metadata(file_path, self.project_root)
+        try:
+            framework = analysis['framework']
+            metadata = analysis['metadata']
 
             # Check for existing story
             story_info = self._find_story_file(file_path)
@@ -225,14 +549,16 @@ class ComponentDiscovery:
             # Determine atomic type
             atomic_type = self._classify_atomic_type(file_path)
 
+            # Framework and suffix repeat across the inventory; analyses come back from
+            # workers and the cache as fresh copies, so share one object per value
             return ComponentInfo(
                 name=metadata.get('name', file_path.stem),
                 path=str(file_path.relative_to(self.project_root)),
-                framework=framework,
-                file_type=file_path.suffix,
+                framework=sys.intern(framework),
+                file_type=sys.intern(file_path.suffix),
                 has_story=story_info['exists'],
                 story_path=story_info['path'] if story_info['exists'] else None,
-                last_modified=datetime.fromtimestamp(stat.st_mtime),
+                last_modified=stat.st_mtime,
                 file_size=stat.st_size,
                 props_count=len(metadata.get('props', [])),
                 events_count=len(metadata.get('events', [])),
@@ -249,35 +575,6 @@ class ComponentDiscovery:
             print(f"  Error analyzing {file_path}: {e}")
             return None
 
-    def _detect_framework(self, file_path: Path) -> str:
-        """Detect which framework a component uses"""
-        extension = file_path.suffix
-
-        if extension in ['.tsx', '.jsx']:
-            return 'react'
-        elif extension == '.vue':
-            return 'vue'
-        elif extension == '.svelte':
-            return 'svelte'
-        elif extension in ['.ts', '.js']:
-            # Check content for framework indicators
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read(1000)  # Read first 1KB
-
-                if 'Vue' in content or '@vue' in content:
-                    return 'vue'
-                elif 'React' in content or 'ReactComponent' in content:
-                    return 'react'
-                elif 'customElements' in content or 'HTMLElement' in content:
-                    return 'web-components'
-                else:
-                    return 'react'  # Default assumption
-            except Exception:
-                return 'react'  # Default assumption
-
-        return 'unknown'
-
     def _find_story_file(self, component_path: Path) -> Dict[str, Any]:
         """Find corresponding story file for a component"""
         component_name = component_path.stem
@@ -307,53 +604,20 @@ class ComponentDiscovery:
 
     def _classify_atomic_type(self, file_path: Path) -> Optional[str]:
         """Classify component according to atomic design"""
-        path_parts = [part.lower() for part in file_path.parts]
-        filename = file_path.stem.lower()
-
-        # Atoms (smallest indivisible elements)
-        atom_patterns = ['atoms', 'atom', 'elements', 'base']
-        atom_components = ['button', 'input', 'label', 'icon', 'avatar', 'badge']
-
-        if any(pattern in path_parts for pattern in atom_patterns):
-            return 'atom'
-        if any(comp in filename for comp in atom_components):
-            return 'atom'
-
-        # Molecules (simple groups of atoms)
-        molecule_patterns = ['molecules', 'molecule']
-        molecule_components = ['form', 'card', 'modal', 'tooltip', 'dropdown', 'search']
-
-        if any(pattern in path_parts for pattern in molecule_patterns):
-            return 'molecule'
-        if any(comp in filename for comp in molecule_components):
-            return 'molecule'
-
-        # Organisms (complex UI sections)
-        organism_patterns = ['organisms', 'organism']
-        organism_components = ['header', 'footer', 'sidebar', 'navbar', 'layout', 'table']
-
-        if any(pattern in path_parts for pattern in organism_patterns):
-            return 'organism'
-        if any(comp in filename for comp in organism_components):
-            return 'organism'
-
-        # Templates (page layouts)
-        template_patterns = ['templates', 'template', 'layouts', 'layout']
-        template_components = ['page', 'template', 'layout']
-
-        if any(pattern in path_parts for pattern in template_patterns):
-            return 'template'
-        if any(comp in filename for comp in template_components):
-            return 'template'
-
-        # Pages (specific instances)
-        page_patterns = ['pages', 'page', 'views', 'view']
-
-        if any(pattern in path_parts for pattern in page_patterns):
-            return 'page'
+        stem_lower, parts_lower = _lowercase_path(file_path)
+        subject = '/' + '/'.join(parts_lower) + '/\0' + stem_lower
+        atomic_match = self.ATOMIC_TYPE_MATCHER.match(subject)
+        if atomic_match:
+            return atomic_match.lastgroup
 
         return None  # Could not classify
 
+    def _classify_atomic_types(self):
+        """Apply the atomic design setting to the discovered components"""
+        if not self.config.get('classification', {}).get('atomic_design', True):
+            for component in self.components:
+                component.atomic_type = None
+
     def _calculate_complexity(self, metadata: Dict[str, Any]) -> float:
         """Calculate complexity score for a component"""
         complexity = 0.0
@@ -385,30 +649,50 @@ class ComponentDiscovery:
 
         return min(complexity, 1.0)
 
-    def _get_code_owner(self, file_path: Path) -> Optional[str]:
-        """Get code owner from git blame or file headers"""
+    def _load_code_owners(self, component_files: List[Path]) -> Dict[str, str]:
+        """Map each component file to the author of its latest commit with one git log walk"""
+        wanted = set()
+        for file_path in component_files:
+            try:
+                wanted.add(file_path.relative_to(self.project_root).as_posix())
+            except ValueError:
+                pass
+
+        author_by_path = {}
         try:
-            # Try git blame to find main contributor
             repo = git.Repo(self.project_root)
-            blame_output = repo.git.blame(str(file_path), line_range='1,1')
-
-            # Extract author from blame output
-            if '(' in blame_output:
-                author_part = blame_output.split('(')[1].split(')')[0]
-                author = author_part.strip().split()[-1]
-                return author if author and author != 'Not' else None
+            # -z keeps paths unquoted; each commit starts with its marker line
+            log_output = repo.git.log('-z', '--name-only', '--no-renames', '--pretty=format:__COMMIT__%an')
         except Exception:
+            return author_by_path
+
+        author = None
+        for entry in log_output.split('\0'):
+            if entry.startswith('__COMMIT__'):
+                author, _, entry = entry[len('__COMMIT__'):].partition('\n')
+            # Log is newest first, so the first author seen for a path is the latest
+            if entry in wanted and author and entry not in author_by_path:
+                author_by_path[entry] = sys.intern(author)
+
+        return author_by_path
+
+    def _get_code_owner(self, file_path: Path) -> Optional[str]:
+        """Get code owner from git history or file headers"""
+        try:
+            author = self._author_by_path.get(file_path.relative_to(self.project_root).as_posix())
+            if author:
+                return author
+        except ValueError:
             pass
 
         # Try to extract from file header
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                first_lines = [f.readline().strip() for _ in range(5)]
+            first_lines = [line.strip() for line in _read_text(file_path).split('\n', 5)[:5]]
 
             for line in first_lines:
                 if '@author' in line or 'Author:' in line:
                     # Extract author name
-                    author_match = re.search(r'@author\s+(.+)|Author:\s+(.+)', line)
+                    author_match = _AUTHOR_HEADER.search(line)
                     if author_match:
                         return author_match.group(1) or author_match.group(2)
         except Exception:
@@ -422,71 +706,80 @@ class ComponentDiscovery:
 
         # Build usage map
         for component in self.components:
-            component_name = component.name
             component.import_names = self._get_component_import_names(component)
-            component.usage_count = self._count_component_usages(component)
+
+        usage_counts = self._count_component_usages()
+        for component, usage_count in zip(self.components, usage_counts):
+            component.usage_count = usage_count
 
     def _get_component_import_names(self, component: ComponentInfo) -> Set[str]:
         """Get all possible import names for a component"""
-        names = set()
-
-        # Primary name
-        names.add(component.name)
-
-        # Common variations
+        # Primary name, plus the common variation without a 'Component' suffix.
+        # Case variants are left out: usages are matched case-sensitively and a
+        # lowercased tag such as <button> is a native element, not the component.
+        names = {component.name}
         if component.name.endswith('Component'):
-            names.add(component.name[:-9])  # Remove 'Component'
-
-        # Case variations
-        names.update([name.lower() for name in names])
-        names.update([name.upper() for name in names])
+            names.add(component.name[:-9])
 
         return names
 
-    def _count_component_usages(self, component: ComponentInfo) -> int:
-        """Count how many times a component is used"""
-        if not hasattr(component, 'import_names'):
-            component.import_names = set([component.name])
-
-        usage_count = 0
-
-        try:
-            # Search through source files
-            source_extensions = ['.tsx', '.jsx', '.vue', '.ts', '.js']
+    def _count_component_usages(self) -> List[int]:
+        """Count how many times each component is used, in one pass over the source files"""
+        usage_counts = [0] * len(self.components)
 
-            for ext in source_extensions:
-                for file_path in self.project_root.rglob(f"*{ext}"):
-                    if self._should_ignore_file(file_path):
-                        continue
+        # Map every import name to the components it may refer to
+        owners = defaultdict(list)
+        for index, component in enumerate(self.components):
+            if not hasattr(component, 'import_names'):
+                component.import_names = set([component.name])
+            for import_name in component.import_names:
+                owners[import_name].append(index)
 
-                    if file_path.samefile(Path(component.path)):
-                        continue  # Skip the component file itself
+        if not owners:
+            return usage_counts
 
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
+        # One bytes alternation of every name per usage pattern (files are scanned
+        # undecoded); longer names first so a name never shadows a longer one it is a prefix of
+        names = b'(' + b'|'.join(re.escape(name.encode()) for name in sorted(owners, key=len, reverse=True)) + b')'
+        jsx_usage = re.compile(b'<' + names + rb'(?!\w)')
+        create_element_usage = re.compile(rb'React\.createElement\s*\(\s*' + names + rb'(?!\w)')
+        name_usage = re.compile(rb'(?<!\w)' + names + rb'(?!\w)')
 
-                        # Check for component usage patterns
-                        for import_name in component.import_names:
-                            # JSX usage
-                            if f"<{import_name}" in content:
-                                usage_count += content.count(f"<{import_name}")
+        usage_patterns = (jsx_usage, create_element_usage, name_usage)
 
-                            # Import usage
-                            if f"import.*{import_name}" in content:
-                                usage_count += 1
+        try:
+            # Search through source files
+            if self._source_files is None:
+                self._source_files = self._find_source_files()
+            source_files = self._source_files
+
+            # Scanning is independent per file; chunks keep pattern pickling per worker task
+            if len(source_files) > PARALLEL_ANALYSIS_THRESHOLD:
+                chunks = [source_files[i:i + PARALLEL_CHUNK_SIZE]
+                          for i in range(0, len(source_files), PARALLEL_CHUNK_SIZE)]
+                with ProcessPoolExecutor() as executor:
+                    file_counts = [
+                        counts
+                        for chunk_counts in executor.map(_count_usages_in_files, chunks, repeat(usage_patterns))
+                        for counts in chunk_counts
+                    ]
+            else:
+                file_counts = _count_usages_in_files(source_files, usage_patterns)
 
-                            # React.createElement usage
-                            if f"React.createElement.*{import_name}" in content:
-                                usage_count += content.count(f"React.createElement.*{import_name}")
+            # Component paths are relative to the project root the source files were found under
+            component_paths = [str(self.project_root / component.path) for component in self.components]
 
-                    except Exception:
-                        continue
+            for file_path, counts in zip(source_files, file_counts):
+                file_str = str(file_path)
+                for import_name, count in counts.items():
+                    for index in owners[import_name]:
+                        if file_str != component_paths[index]:
+                            usage_counts[index] += count  # The component's own file is skipped
 
         except Exception:
             pass
 
-        return usage_count
+        return usage_counts
 
     def _assign_priorities(self):
         """Assign priorities to components based on usage and complexity"""
@@ -515,78 +808,86 @@ class ComponentDiscovery:
                 'ComplexityScore', 'UsageCount', 'CodeOwner', 'Priority',
                 'AtomicType', 'DesignLink'
             ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for component in sorted(self.components, key=lambda x: x.priority, reverse=True):
-                writer.writerow({
-                    'Component': component.name,
-                    'Path': component.path,
-                    'Framework': component.framework,
-                    'HasStory': component.has_story,
-                    'StoryPath': component.story_path or '',
-                    'LastModified': component.last_modified.strftime('%Y-%m-%d %H:%M:%S'),
-                    'FileSize': component.file_size,
-                    'PropsCount': component.props_count,
-                    'EventsCount': component.events_count,
-                    'ComplexityScore': f"{component.complexity_score:.2f}",
-                    'UsageCount': component.usage_count,
-                    'CodeOwner': component.code_owner or '',
-                    'Priority': component.priority,
-                    'AtomicType': component.atomic_type or '',
-                    'DesignLink': component.design_link or ''
-                })
+            writer = csv.writer(csvfile)
+
+            # Rows are plain tuples in fieldnames order
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (
+                    component.name,
+                    component.path,
+                    component.framework,
+                    component.has_story,
+                    component.story_path or '',
+                    datetime.fromtimestamp(component.last_modified).strftime('%Y-%m-%d %H:%M:%S'),
+                    component.file_size,
+                    component.props_count,
+                    component.events_count,
+                    f"{component.complexity_score:.2f}",
+                    component.usage_count,
+                    component.code_owner or '',
+                    component.priority,
+                    component.atomic_type or '',
+                    component.design_link or ''
+                )
+                for component in sorted(self.components, key=lambda x: _PRIORITY_RANK.get(x.priority, len(_PRIORITY_RANK)))
+            )
 
         print(f"📄 Inventory saved to: {output_path}")
 
     def generate_missing_stories_report(self, output_path: str = 'missing-stories-report.md'):
         """Generate report of components missing stories"""
         missing_components = [c for c in self.components if not c.has_story]
-        outdated_components = [c for c in self.components if self._is_story_outdated(c)]
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("# Missing Stories Report\n\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            # Summary
-            total_components = len(self.components)
-            documented_components = total_components - len(missing_components)
-            coverage = (documented_components / total_components * 100) if total_components > 0 else 0
-
-            f.write("## Summary\n\n")
-            f.write(f"- **Total Components**: {total_components}\n")
-            f.write(f"- **Documented Components**: {documented_components}\n")
-            f.write(f"- **Missing Stories**: {len(missing_components)}\n")
-            f.write(f"- **Coverage**: {coverage:.1f}%\n\n")
-
-            if missing_components:
-                f.write("## High Priority (Essential Components)\n\n")
-                high_priority = [c for c in missing_components if c.priority == 'high']
-                for component in sorted(high_priority, key=lambda x: x.usage_count, reverse=True):
-                    f.write(f"- **{component.name}** (`{component.path}`)\n")
-                    f.write(f"  - Framework: {component.framework}\n")
-                    f.write(f"  - Usage: {component.usage_count} times\n")
-                    f.write(f"  - Complexity: {component.complexity_score:.2f}\n")
-                    f.write(f"  - Code Owner: {component.code_owner or 'Unknown'}\n\n")
-
-                f.write("## Medium Priority\n\n")
-                medium_priority = [c for c in missing_components if c.priority == 'medium']
-                for component in sorted(medium_priority, key=lambda x: x.usage_count, reverse=True):
-                    f.write(f"- **{component.name}** (`{component.path}`)\n")
-                    f.write(f"  - Framework: {component.framework}\n")
-                    f.write(f"  - Usage: {component.usage_count} times\n\n")
-
-                f.write("## Low Priority\n\n")
-                low_priority = [c for c in missing_components if c.priority == 'low']
-                for component in sorted(low_priority, key=lambda x: x.usage_count, reverse=True):
-                    f.write(f"- **{component.name}** (`{component.path}`)\n")
-
-            if outdated_components:
-                f.write("\n## Outdated Stories\n\n")
-                for component in outdated_components:
-                    f.write(f"- **{component.name}** - Story older than component\n")
-                    f.write(f"  - Component: `{component.path}`\n")
-                    f.write(f"  - Story: `{component.story_path}`\n\n")
+        outdated_components = [c for c in self.components if c.story_outdated]
+
+        # Assemble the report in memory and write it with a single call
+        report = []
+        report.append("# Missing Stories Report\n\n")
+        report.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        # Summary
+        total_components = len(self.components)
+        documented_components = total_components - len(missing_components)
+        coverage = (documented_components / total_components * 100) if total_components > 0 else 0
+
+        report.append("## Summary\n\n")
+        report.append(f"- **Total Components**: {total_components}\n")
+        report.append(f"- **Documented Components**: {documented_components}\n")
+        report.append(f"- **Missing Stories**: {len(missing_components)}\n")
+        report.append(f"- **Coverage**: {coverage:.1f}%\n\n")
+
+        if missing_components:
+            # Most used first within each priority
+            by_priority = defaultdict(list)
+            for component in sorted(missing_components, key=lambda x: x.usage_count, reverse=True):
+                by_priority[component.priority].append(component)
+
+            report.append("## High Priority (Essential Components)\n\n")
+            for component in by_priority['high']:
+                report.append(f"- **{component.name}** (`{component.path}`)\n")
+                report.append(f"  - Framework: {component.framework}\n")
+                report.append(f"  - Usage: {component.usage_count} times\n")
+                report.append(f"  - Complexity: {component.complexity_score:.2f}\n")
+                report.append(f"  - Code Owner: {component.code_owner or 'Unknown'}\n\n")
+
+            report.append("## Medium Priority\n\n")
+            for component in by_priority['medium']:
+                report.append(f"- **{component.name}** (`{component.path}`)\n")
+                report.append(f"  - Framework: {component.framework}\n")
+                report.append(f"  - Usage: {component.usage_count} times\n\n")
+
+            report.append("## Low Priority\n\n")
+            for component in by_priority['low']:
+                report.append(f"- **{component.name}** (`{component.path}`)\n")
+
+        if outdated_components:
+            report.append("\n## Outdated Stories\n\n")
+            for component in outdated_components:
+                report.append(f"- **{component.name}** - Story older than component\n")
+                report.append(f"  - Component: `{component.path}`\n")
+                report.append(f"  - Story: `{component.story_path}`\n\n")
+
+        Path(output_path).write_text(''.join(report), encoding='utf-8')
 
         print(f"📋 Missing stories report saved to: {output_path}")
 
@@ -596,64 +897,56 @@ class ComponentDiscovery:
             return False
 
         try:
-            story_path = Path(component.story_path)
-            if not story_path.exists():
-                return True
-
-            story_mtime = story_path.stat().st_mtime
-            component_mtime = component.last_modified.timestamp()
-
-            return story_mtime < component_mtime
+            story_mtime = Path(component.story_path).stat().st_mtime
+        except FileNotFoundError:
+            return True
         except Exception:
             return False
 
-    def generate_component_update_map(self, output_path: str = 'component-update-map.json'):
-        """Generate JSON mapping of components to their update status"""
+        return story_mtime < component.last_modified
+
+    def generate_component_update_map(self, output_path: str = 'component-update-map.json', pretty: bool = False):
+        """Generate JSON mapping of components to their update status (compact unless pretty)"""
+        fromtimestamp = datetime.fromtimestamp
         update_map = {
             'generated_at': datetime.now().isoformat(),
             'total_components': len(self.components),
-            'frameworks': {},
-            'atomic_types': {},
-            'priority_distribution': {},
-            'components': []
+            # Statistics, counted in one pass each
+            'frameworks': dict(Counter(c.framework for c in self.components)),
+            'atomic_types': dict(Counter(c.atomic_type or 'unclassified' for c in self.components)),
+            'priority_distribution': dict(Counter(c.priority for c in self.components)),
+            # Flat records built field by field; asdict would deep-copy each component's metadata
+            'components': [
+                {
+                    'name': component.name,
+                    'path': component.path,
+                    'framework': component.framework,
+                    'has_story': component.has_story,
+                    'story_path': component.story_path,
+                    'needs_story': not component.has_story,
+                    'story_outdated': component.story_outdated,
+                    'priority': component.priority,
+                    'atomic_type': component.atomic_type,
+                    'complexity_score': component.complexity_score,
+                    'usage_count': component.usage_count,
+                    'last_modified': fromtimestamp(component.last_modified).isoformat(),
+                    'props_count': component.props_count,
+                    'events_count': component.events_count
+                }
+                for component in self.components
+            ]
         }
 
-        for component in self.components:
-            component_data = {
-                'name': component.name,
-                'path': component.path,
-                'framework': component.framework,
-                'has_story': component.has_story,
-                'story_path': component.story_path,
-                'needs_story': not component.has_story,
-                'story_outdated': self._is_story_outdated(component) if component.has_story else False,
-                'priority': component.priority,
-                'atomic_type': component.atomic_type,
-                'complexity_score': component.complexity_score,
-                'usage_count': component.usage_count,
-                'last_modified': component.last_modified.isoformat(),
-                'props_count': component.props_count,
-                'events_count': component.events_count
-            }
-
-            update_map['components'].append(component_data)
+        if orjson is not None:
+            data = orjson.dumps(update_map, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            data = json.dumps(update_map, indent=2 if pretty else None).encode('utf-8')
 
-            # Update statistics
-            framework = component.framework
-            update_map['frameworks'][framework] = update_map['frameworks'].get(framework, 0) + 1
-
-            atomic_type = component.atomic_type or 'unclassified'
-            update_map['atomic_types'][atomic_type] = update_map['atomic_types'].get(atomic_type, 0) + 1
-
-            priority = component.priority
-            update_map['priority_distribution'][priority] = update_map['priority_distribution'].get(priority, 0) + 1
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(update_map, f, indent=2)
+        Path(output_path).write_bytes(data)
 
         print(f"🗺️ Component update map saved to: {output_path}")
 
-    def run_discovery(self) -> Dict[str, Any]:
+    def run_discovery(self, pretty: bool = False) -> Dict[str, Any]:
         """Run complete discovery process"""
         print("🚀 Starting component discovery...")
 
@@ -664,11 +957,17 @@ class ComponentDiscovery:
         output_dir = Path('.')
         self.generate_inventory_csv(output_dir / 'storybook-inventory.csv')
         self.generate_missing_stories_report(output_dir / 'missing-stories-report.md')
-        self.generate_component_update_map(output_dir / 'component-update-map.json')
+        self.generate_component_update_map(output_dir / 'component-update-map.json', pretty=pretty)
 
-        # Summary statistics
+        # Summary statistics, gathered in a single pass over the inventory
         total = len(self.components)
-        with_stories = len([c for c in self.components if c.has_story])
+        with_stories = 0
+        high_priority = 0
+        frameworks = {}
+        for component in self.components:
+            with_stories += component.has_story
+            high_priority += component.priority == 'high'
+            frameworks[component.framework] = None
         missing_stories = total - with_stories
 
         summary = {
@@ -676,8 +975,8 @@ class ComponentDiscovery:
             'components_with_stories': with_stories,
             'missing_stories': missing_stories,
             'coverage_percentage': (with_stories / total * 100) if total > 0 else 0,
-            'frameworks': list(set(c.framework for c in self.components)),
-            'high_priority_components': len([c for c in self.components if c.priority == 'high'])
+            'frameworks': list(frameworks),
+            'high_priority_components': high_priority
         }
 
         print(f"\n📊 Discovery Summary:")
@@ -692,14 +991,93 @@ class ComponentDiscovery:
 
 # Framework Handlers
 
+# Framework handler patterns, compiled once at import
+
+# Body of a {...} block up to its first closing brace. The body can never give characters
+# back to the closing brace, so it is matched possessively where re supports it (3.11+)
+# and an unclosed block fails without backtracking through every shorter body.
+_BRACE_BODY = r'([^}]++)' if sys.version_info >= (3, 11) else r'([^}]+)'
+
+# React
+_EXPORT_DEFAULT_NAME = re.compile(r'export default\s+(?:function\s+)?(\w+)')
+_FUNCTION_NAME = re.compile(r'function\s+(\w+)')
+_COMPONENT_CLASS_NAME = re.compile(r'class\s+(\w+).*extends.*Component')
+_TS_PROPS_INTERFACE = re.compile(r'interface\s+\w+Props\s*{' + _BRACE_BODY + '}', re.DOTALL)
+_PROP_TYPES_BLOCK = re.compile(r'\.propTypes\s*=\s*{' + _BRACE_BODY + '}', re.DOTALL)
+_ARROW_EVENT_PROP = re.compile(r'(\w+):\s*\((.*?)\)\s*=>')
+# Anchored at a word start: a match can never begin mid-identifier, and without the
+# anchor re retries every suffix of every word that is not followed by '='
+_ARROW_METHOD = re.compile(r'\b(\w+)\s*=\s*\([^)]*\)\s*=>')
+# Dynamic import('...') or ES6 import ... from '...', collected in source order in one pass
+_STATIC_OR_DYNAMIC_IMPORT = re.compile(
+    r'import\s*\([\'"]([^\'"]+)[\'"]\)|import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]'
+)
+
+# Shared by several frameworks
+_CLASS_METHOD = re.compile(r'^\s*(\w+)\s*\([^)]*\)\s*{', re.MULTILINE)
+_ES6_IMPORT = re.compile(r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]')
+_SCRIPT_BLOCK = re.compile(r'<script[^>]*>(.*?)</script>', re.DOTALL)
+
+# Vue
+_VUE_NAME_OPTION = re.compile(r'name:\s*[\'"]([^\'"]+)[\'"]')
+_VUE_PROPS_BLOCK = re.compile(r'props:\s*{' + _BRACE_BODY + '}', re.DOTALL)
+_VUE_EMIT = re.compile(r'this\.\$emit\s*\([\'"]([^\'"]+)[\'"]')
+_VUE_METHODS_BLOCK = re.compile(r'methods:\s*{' + _BRACE_BODY + '}', re.DOTALL)
+_TEMPLATE_BLOCK = re.compile(r'<template[^>]*>(.*?)</template>', re.DOTALL)
+
+# Svelte
+_SVELTE_NAME_EXPORT = re.compile(r'export\s+let\s+name\s*=\s*[\'"]([^\'"]+)[\'"]')
+_SVELTE_EXPORT_LET = re.compile(r'export\s+let\s+(\w+)(?::\s*([^=]+))?(?=\s*=|;|$)')
+_SVELTE_DISPATCHER = re.compile(r'createEventDispatcher\(\)')
+_SVELTE_DISPATCH = re.compile(r'dispatch\s*\([\'"]([^\'"]+)[\'"]')
+# Script and style sections, stripped together in one pass
+_SCRIPT_OR_STYLE_BLOCK = re.compile(r'<(?:script[^>]*>.*?</script>|style[^>]*>.*?</style>)', re.DOTALL)
+
+# Web Components
+_CUSTOM_ELEMENT_DEFINE = re.compile(r'customElements\.define\s*\([\'"]([^\'"]+)[\'"]')
+_OBSERVED_ATTRIBUTES = re.compile(r'static\s+observedAttributes\s*=\s*\[([^\]]+)\]')
+_CUSTOM_EVENT_DISPATCH = re.compile(r'dispatchEvent\s*\(\s*new\s+CustomEvent\s*\([\'"]([^\'"]+)[\'"]')
+_RENDER_BODY = re.compile(r'render\s*\(\s*\)\s*{' + _BRACE_BODY + '}', re.DOTALL)
+
+# Design links: a quoted value after a figma/design key, or a bare Figma URL. The
+# leading lookahead lets re skip ahead to candidate first letters between attempts.
+_DESIGN_LINK = re.compile(
+    r'(?=[fdh])(?:(?:figma(?:Url)?|designUrl)[:\s]*[\'"]([^\'"]+)[\'"]|(https?://figma\.com/[^\s\'"]+))',
+    re.IGNORECASE
+)
+
+# Every design link match contains one of these (lowercase) words
+_DESIGN_LINK_KEYWORDS = ('figma', 'design')
+
+
+def _stripped_lines(text: str) -> List[str]:
+    """Non-blank lines of a block, each stripped once"""
+    return [stripped for line in text.split('\n') if (stripped := line.strip())]
+
+
+def _count_nonblank_lines(text: str) -> int:
+    """Count lines holding anything but whitespace, without copying them"""
+    return sum(1 for line in text.split('\n') if line and not line.isspace())
+
+
+def _extract_design_link(content: str) -> Optional[str]:
+    """Extract Figma or design link (shared by all framework handlers)"""
+    # Most components carry no design link; a substring check rules them out cheaply
+    content_lower = content.lower()
+    if not any(keyword in content_lower for keyword in _DESIGN_LINK_KEYWORDS):
+        return None
+
+    match = _DESIGN_LINK.search(content)
+    return (match.group(1) or match.group(2)) if match else None
+
+
 class ReactComponentHandler:
     """Handler for React components"""
 
     def extract_metadata(self, file_path: Path, project_root: Path) -> Dict[str, Any]:
         """Extract metadata from React component"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(file_path)
 
             metadata = {
                 'name': self._extract_component_name(content, file_path),
@@ -708,7 +1086,7 @@ class ReactComponentHandler:
                 'methods': self._extract_methods(content),
                 'imports': self._extract_imports(content),
                 'template_lines': self._count_jsx_lines(content),
-                'design_link': self._extract_design_link(content)
+                'design_link': _extract_design_link(content)
             }
 
             return metadata
@@ -720,17 +1098,17 @@ class ReactComponentHandler:
     def _extract_component_name(self, content: str, file_path: Path) -> str:
         """Extract component name from content"""
         # Try export default name
-        export_match = re.search(r'export default\s+(?:function\s+)?(\w+)', content)
+        export_match = _EXPORT_DEFAULT_NAME.search(content)
         if export_match:
             return export_match.group(1)
 
         # Try function name
-        func_match = re.search(r'function\s+(\w+)', content)
+        func_match = _FUNCTION_NAME.search(content)
         if func_match:
             return func_match.group(1)
 
         # Try class name
-        class_match = re.search(r'class\s+(\w+).*extends.*Component', content)
+        class_match = _COMPONENT_CLASS_NAME.search(content)
         if class_match:
             return class_match.group(1)
 
@@ -742,13 +1120,13 @@ class ReactComponentHandler:
         props = []
 
         # TypeScript interface
-        interface_match = re.search(r'interface\s+\w+Props\s*{([^}]+)}', content, re.DOTALL)
+        interface_match = _TS_PROPS_INTERFACE.search(content)
         if interface_match:
             interface_content = interface_match.group(1)
-            prop_lines = [line.strip() for line in interface_content.split('\n') if line.strip()]
+            prop_lines = _stripped_lines(interface_content)
 
             for line in prop_lines:
-                if ':' in line and not line.strip().startswith('//'):
+                if ':' in line and not line.startswith('//'):
                     prop_parts = line.split(':')
                     if len(prop_parts) >= 2:
                         prop_name = prop_parts[0].strip().replace('?', '')
@@ -756,13 +1134,13 @@ class ReactComponentHandler:
                         props.append({'name': prop_name, 'type': prop_type})
 
         # PropTypes
-        proptypes_match = re.search(r'\.propTypes\s*=\s*{([^}]+)}', content, re.DOTALL)
+        proptypes_match = _PROP_TYPES_BLOCK.search(content)
         if proptypes_match:
             proptypes_content = proptypes_match.group(1)
-            prop_lines = [line.strip() for line in proptypes_content.split('\n') if line.strip()]
+            prop_lines = _stripped_lines(proptypes_content)
 
             for line in prop_lines:
-                if ':' in line and not line.strip().startswith('//'):
+                if ':' in line and not line.startswith('//'):
                     prop_parts = line.split(':')
                     if len(prop_parts) >= 2:
                         prop_name = prop_parts[0].strip()
@@ -776,7 +1154,7 @@ class ReactComponentHandler:
         events = []
 
         # Look for on* props
-        event_match = re.findall(r'(\w+):\s*\((.*?)\)\s*=>', content)
+        event_match = _ARROW_EVENT_PROP.findall(content)
         for event_name, params in event_match:
             if event_name.startswith('on') or event_name.startswith('handle'):
                 events.append({'name': event_name, 'params': params})
@@ -785,57 +1163,31 @@ class ReactComponentHandler:
 
     def _extract_methods(self, content: str) -> List[str]:
         """Extract component methods"""
-        methods = []
-
-        # Arrow function methods
-        method_match = re.findall(r'(\w+)\s*=\s*\([^)]*\)\s*=>', content)
-        methods.extend(method_match)
-
-        # Regular methods
-        method_match = re.findall(r'^\s*(\w+)\s*\([^)]*\)\s*{', content, re.MULTILINE)
-        methods.extend(method_match)
-
-        return methods
+        # Arrow function methods, then regular methods
+        matches = chain(_ARROW_METHOD.finditer(content), _CLASS_METHOD.finditer(content))
+        return [match.group(1) for match in matches]
 
     def _extract_imports(self, content: str) -> List[str]:
         """Extract imports"""
-        imports = []
-
-        # ES6 imports
-        import_match = re.findall(r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]', content)
-        imports.extend(import_match)
-
-        # Dynamic imports
-        dynamic_match = re.findall(r'import\s*\([\'"]([^\'"]+)[\'"]\)', content)
-        imports.extend(dynamic_match)
-
-        return imports
+        return [dynamic or static for dynamic, static in _STATIC_OR_DYNAMIC_IMPORT.findall(content)]
 
     def _count_jsx_lines(self, content: str) -> int:
         """Count lines containing JSX"""
+        # Jump between '<' characters instead of splitting, so lines without one are
+        # skipped in C; each candidate line is then checked for '>' and a // comment.
         jsx_lines = 0
-        for line in content.split('\n'):
-            if '<' in line and '>' in line and not line.strip().startswith('//'):
+        find = content.find
+        lt = find('<')
+        while lt >= 0:
+            start = content.rfind('\n', 0, lt) + 1
+            end = find('\n', lt)
+            if end < 0:
+                end = len(content)
+            if find('>', start, end) >= 0 and not content[start:end].lstrip().startswith('//'):
                 jsx_lines += 1
+            lt = find('<', end)
         return jsx_lines
 
-    def _extract_design_link(self, content: str) -> Optional[str]:
-        """Extract Figma or design link"""
-        # Look for common design link patterns
-        figma_patterns = [
-            r'figmaUrl[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'figma[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'designUrl[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'https?://figma\.com/[^\s\'"]+'
-        ]
-
-        for pattern in figma_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return None
-
 
 class VueComponentHandler:
     """Handler for Vue components"""
@@ -843,17 +1195,24 @@ class VueComponentHandler:
     def extract_metadata(self, file_path: Path, project_root: Path) -> Dict[str, Any]:
         """Extract metadata from Vue component"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(file_path)
+
+            # Slice the file once: component options live in the script blocks
+            # (<script> and <script setup>), markup in the template. Plain .ts/.js
+            # modules routed here have no blocks and are all script.
+            script_blocks = _SCRIPT_BLOCK.findall(content)
+            script_content = '\n'.join(script_blocks) if script_blocks else content
+            template_match = _TEMPLATE_BLOCK.search(content)
+            template_content = template_match.group(1) if template_match else None
 
             metadata = {
-                'name': self._extract_component_name(content, file_path),
-                'props': self._extract_vue_props(content),
-                'events': self._extract_vue_events(content),
-                'methods': self._extract_vue_methods(content),
-                'imports': self._extract_vue_imports(content),
-                'template_lines': self._count_template_lines(content),
-                'design_link': self._extract_design_link(content)
+                'name': self._extract_component_name(script_content, file_path),
+                'props': self._extract_vue_props(script_content),
+                'events': self._extract_vue_events(script_content),
+                'methods': self._extract_vue_methods(script_content),
+                'imports': self._extract_vue_imports(script_content),
+                'template_lines': self._count_template_lines(template_content),
+                'design_link': _extract_design_link(content)
             }
 
             return metadata
@@ -865,7 +1224,7 @@ class VueComponentHandler:
     def _extract_component_name(self, content: str, file_path: Path) -> str:
         """Extract component name from Vue file"""
         # Look for name in script section
-        name_match = re.search(r'name:\s*[\'"]([^\'"]+)[\'"]', content)
+        name_match = _VUE_NAME_OPTION.search(content)
         if name_match:
             return name_match.group(1)
 
@@ -877,13 +1236,13 @@ class VueComponentHandler:
         props = []
 
         # Props object
-        props_match = re.search(r'props:\s*{([^}]+)}', content, re.DOTALL)
+        props_match = _VUE_PROPS_BLOCK.search(content)
         if props_match:
             props_content = props_match.group(1)
-            prop_lines = [line.strip() for line in props_content.split('\n') if line.strip()]
+            prop_lines = _stripped_lines(props_content)
 
             for line in prop_lines:
-                if ':' in line and not line.strip().startswith('//'):
+                if ':' in line and not line.startswith('//'):
                     prop_parts = line.split(':')
                     if len(prop_parts) >= 2:
                         prop_name = prop_parts[0].strip()
@@ -897,7 +1256,7 @@ class VueComponentHandler:
         events = []
 
         # Emit calls
-        emit_match = re.findall(r'this\.\$emit\s*\([\'"]([^\'"]+)[\'"]', content)
+        emit_match = _VUE_EMIT.findall(content)
         for event_name in emit_match:
             events.append({'name': event_name, 'params': 'event'})
 
@@ -908,10 +1267,10 @@ class VueComponentHandler:
         methods = []
 
         # Methods object
-        methods_match = re.search(r'methods:\s*{([^}]+)}', content, re.DOTALL)
+        methods_match = _VUE_METHODS_BLOCK.search(content)
         if methods_match:
             methods_content = methods_match.group(1)
-            method_lines = [line.strip() for line in methods_content.split('\n') if line.strip()]
+            method_lines = _stripped_lines(methods_content)
 
             for line in method_lines:
                 if '(' in line and ')' in line and '{' in line:
@@ -921,44 +1280,16 @@ class VueComponentHandler:
 
         return methods
 
-    def _extract_vue_imports(self, content: str) -> List[str]:
-        """Extract imports from Vue component"""
-        imports = []
-
-        # Script section imports
-        script_match = re.search(r'<script[^>]*>(.*?)</script>', content, re.DOTALL)
-        if script_match:
-            script_content = script_match.group(1)
-
-            # ES6 imports
-            import_match = re.findall(r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]', script_content)
-            imports.extend(import_match)
-
-        return imports
-
-    def _count_template_lines(self, content: str) -> int:
-        """Count template lines"""
-        template_match = re.search(r'<template[^>]*>(.*?)</template>', content, re.DOTALL)
-        if template_match:
-            template_content = template_match.group(1)
-            return len([line for line in template_content.split('\n') if line.strip()])
-        return 0
-
-    def _extract_design_link(self, content: str) -> Optional[str]:
-        """Extract Figma or design link"""
-        # Similar to React handler
-        figma_patterns = [
-            r'figmaUrl[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'figma[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'https?://figma\.com/[^\s\'"]+'
-        ]
-
-        for pattern in figma_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1)
+    def _extract_vue_imports(self, script_content: str) -> List[str]:
+        """Extract imports from the Vue component's script blocks"""
+        # ES6 imports
+        return _ES6_IMPORT.findall(script_content)
 
-        return None
+    def _count_template_lines(self, template_content: Optional[str]) -> int:
+        """Count non-blank lines of the Vue component's template"""
+        if template_content is None:
+            return 0
+        return _count_nonblank_lines(template_content)
 
 
 class SvelteComponentHandler:
@@ -967,17 +1298,21 @@ class SvelteComponentHandler:
     def extract_metadata(self, file_path: Path, project_root: Path) -> Dict[str, Any]:
         """Extract metadata from Svelte component"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(file_path)
+
+            # Props and imports are declared in the script blocks (instance and
+            # context="module"); events may also be dispatched from markup handlers
+            script_blocks = _SCRIPT_BLOCK.findall(content)
+            script_content = '\n'.join(script_blocks) if script_blocks else content
 
             metadata = {
-                'name': self._extract_component_name(content, file_path),
-                'props': self._extract_svelte_props(content),
+                'name': self._extract_component_name(script_content, file_path),
+                'props': self._extract_svelte_props(script_content),
                 'events': self._extract_svelte_events(content),
                 'methods': [],  # Svelte doesn't have traditional methods
-                'imports': self._extract_svelte_imports(content),
+                'imports': self._extract_svelte_imports(script_content),
                 'template_lines': self._count_template_lines(content),
-                'design_link': self._extract_design_link(content)
+                'design_link': _extract_design_link(content)
             }
 
             return metadata
@@ -989,7 +1324,7 @@ class SvelteComponentHandler:
     def _extract_component_name(self, content: str, file_path: Path) -> str:
         """Extract component name from Svelte file"""
         # Look for export let name
-        name_match = re.search(r'export\s+let\s+name\s*=\s*[\'"]([^\'"]+)[\'"]', content)
+        name_match = _SVELTE_NAME_EXPORT.search(content)
         if name_match:
             return name_match.group(1)
 
@@ -1001,7 +1336,7 @@ class SvelteComponentHandler:
         props = []
 
         # Export let statements
-        export_match = re.findall(r'export\s+let\s+(\w+)(?::\s*([^=]+))?(?=\s*=|;|$)', content)
+        export_match = _SVELTE_EXPORT_LET.findall(content)
         for prop_name, prop_type in export_match:
             props.append({'name': prop_name, 'type': prop_type.strip() if prop_type else 'any'})
 
@@ -1012,53 +1347,23 @@ class SvelteComponentHandler:
         events = []
 
         # CreateEventDispatcher calls
-        dispatch_match = re.findall(r'createEventDispatcher\(\)', content)
+        dispatch_match = _SVELTE_DISPATCHER.findall(content)
         if dispatch_match:
             # Look for dispatch calls
-            dispatch_usage_match = re.findall(r'dispatch\s*\([\'"]([^\'"]+)[\'"]', content)
+            dispatch_usage_match = _SVELTE_DISPATCH.findall(content)
             for event_name in dispatch_usage_match:
                 events.append({'name': event_name, 'params': 'detail'})
 
         return events
 
-    def _extract_svelte_imports(self, content: str) -> List[str]:
-        """Extract imports from Svelte component"""
-        imports = []
-
-        # Script section imports
-        script_match = re.search(r'<script[^>]*>(.*?)</script>', content, re.DOTALL)
-        if script_match:
-            script_content = script_match.group(1)
-
-            # ES6 imports
-            import_match = re.findall(r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]', script_content)
-            imports.extend(import_match)
-
-        return imports
+    def _extract_svelte_imports(self, script_content: str) -> List[str]:
+        """Extract imports from the Svelte component's script blocks"""
+        # ES6 imports
+        return _ES6_IMPORT.findall(script_content)
 
     def _count_template_lines(self, content: str) -> int:
         """Count template lines (outside script and style tags)"""
-        # Remove script and style sections
-        content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL)
-
-        return len([line for line in content.split('\n') if line.strip()])
-
-    def _extract_design_link(self, content: str) -> Optional[str]:
-        """Extract Figma or design link"""
-        # Similar to other handlers
-        figma_patterns = [
-            r'figmaUrl[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'figma[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'https?://figma\.com/[^\s\'"]+'
-        ]
-
-        for pattern in figma_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return None
+        return _count_nonblank_lines(_SCRIPT_OR_STYLE_BLOCK.sub('', content))
 
 
 class WebComponentHandler:
@@ -1067,8 +1372,7 @@ class WebComponentHandler:
     def extract_metadata(self, file_path: Path, project_root: Path) -> Dict[str, Any]:
         """Extract metadata from Web Component"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(file_path)
 
             metadata = {
                 'name': self._extract_component_name(content, file_path),
@@ -1077,7 +1381,7 @@ class WebComponentHandler:
                 'methods': self._extract_web_component_methods(content),
                 'imports': self._extract_imports(content),
                 'template_lines': self._count_template_lines(content),
-                'design_link': self._extract_design_link(content)
+                'design_link': _extract_design_link(content)
             }
 
             return metadata
@@ -1089,7 +1393,7 @@ class WebComponentHandler:
     def _extract_component_name(self, content: str, file_path: Path) -> str:
         """Extract component name from Web Component"""
         # Look for customElements.define
-        define_match = re.search(r'customElements\.define\s*\([\'"]([^\'"]+)[\'"]', content)
+        define_match = _CUSTOM_ELEMENT_DEFINE.search(content)
         if define_match:
             return define_match.group(1)
 
@@ -1101,7 +1405,7 @@ class WebComponentHandler:
         props = []
 
         # Observed properties
-        observed_match = re.search(r'static\s+observedAttributes\s*=\s*\[([^\]]+)\]', content)
+        observed_match = _OBSERVED_ATTRIBUTES.search(content)
         if observed_match:
             attr_list = observed_match.group(1)
             attr_names = [attr.strip().strip('\'"') for attr in attr_list.split(',')]
@@ -1115,7 +1419,7 @@ class WebComponentHandler:
         events = []
 
         # Custom event dispatches
-        dispatch_match = re.findall(r'dispatchEvent\s*\(\s*new\s+CustomEvent\s*\([\'"]([^\'"]+)[\'"]', content)
+        dispatch_match = _CUSTOM_EVENT_DISPATCH.findall(content)
         for event_name in dispatch_match:
             events.append({'name': event_name, 'params': 'detail'})
 
@@ -1123,49 +1427,21 @@ class WebComponentHandler:
 
     def _extract_web_component_methods(self, content: str) -> List[str]:
         """Extract methods from Web Component"""
-        methods = []
-
-        # Class methods
-        method_match = re.findall(r'^\s*(\w+)\s*\([^)]*\)\s*{', content, re.MULTILINE)
-        methods.extend(method_match)
-
-        return methods
+        return _CLASS_METHOD.findall(content)
 
     def _extract_imports(self, content: str) -> List[str]:
         """Extract imports from Web Component"""
-        imports = []
-
-        # ES6 imports
-        import_match = re.findall(r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]', content)
-        imports.extend(import_match)
-
-        return imports
+        return _ES6_IMPORT.findall(content)
 
     def _count_template_lines(self, content: str) -> int:
         """Count template lines"""
         # Look for template literals or render methods
-        template_match = re.search(r'render\s*\(\s*\)\s*{([^}]+)}', content, re.DOTALL)
+        template_match = _RENDER_BODY.search(content)
         if template_match:
-            return len([line for line in template_match.group(1).split('\n') if line.strip()])
+            return _count_nonblank_lines(template_match.group(1))
 
         return 0
 
-    def _extract_design_link(self, content: str) -> Optional[str]:
-        """Extract Figma or design link"""
-        # Similar to other handlers
-        figma_patterns = [
-            r'figmaUrl[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'figma[:\s]*[\'"]([^\'"]+)[\'"]',
-            r'https?://figma\.com/[^\s\'"]+'
-        ]
-
-        for pattern in figma_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return None
-
 
 def main():
     import argparse
@@ -1174,6 +1450,7 @@ def main():
     parser.add_argument('--config', help='Configuration file path')
     parser.add_argument('--output-dir', default='.', help='Output directory for reports')
     parser.add_argument('--component-paths', help='Custom component paths (comma-separated)')
+    parser.add_argument('--pretty', action='store_true', help='Pretty print the component update map')
 
     args = parser.parse_args()
 
@@ -1185,7 +1462,7 @@ def main():
         discovery.config['discovery']['component_paths'] = args.component_paths.split(',')
 
     # Run discovery
-    summary = discovery.run_discovery()
+    summary = discovery.run_discovery(pretty=args.pretty)
 
     print(f"\n📊 Final Summary:")
     print(f"   Components discovered: {summary['total_components']}")
@@ -8,12 +8,91 @@ import os
 import sys
 import json
 import re
-from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Any, Optional
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-import yaml
-import jinja2
+from functools import cached_property, lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON input and output, stdlib json otherwise
+    orjson = None
+
+if TYPE_CHECKING:
+    import jinja2
+
+# Minimum number of queued story files before they are written from a thread pool
+PARALLEL_WRITE_THRESHOLD = 64
+
+# Minimum number of stories before rendering fans out to worker processes
+PARALLEL_RENDER_THRESHOLD = 64
+PARALLEL_CHUNK_SIZE = 8
+
+# Storybook control for each prop type, by generator; other types get a text control
+_REACT_CONTROL_TYPES = {
+    'string': 'text',
+    'number': 'number',
+    'boolean': 'boolean',
+    'enum': 'select',
+    'function': 'action'
+}
+_SVELTE_CONTROL_TYPES = {
+    'string': 'text',
+    'number': 'number',
+    'boolean': 'boolean',
+    'array': 'object',
+    'object': 'object'
+}
+
+# Story arg used for a prop of each type when the prop declares no default
+_DEFAULT_ARG_VALUES = {'string': 'Example', 'number': 0, 'boolean': False}
+
+@lru_cache(maxsize=4096)
+def _is_writable_dir(directory: str) -> bool:
+    """Whether a story can be written into a directory, checked once per directory per run"""
+    return os.path.exists(directory) and os.access(directory, os.W_OK)
+
+def _write_story_file(path: Path, content: str) -> Optional[OSError]:
+    """Write one story file, returning the error instead of raising so a batch can finish"""
+    # Written beside the target and swapped in, so the story is never left half written and
+    # a backup hard-linked to the old file keeps its content
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return e
+    return None
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file from its raw bytes"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# Shared encoder for story args; json.dumps builds a new one per call when indenting
+_ARGS_ENCODER = json.JSONEncoder(indent=6)
+
+# needs_story cells that mark a CSV component row as needing a story
+_CSV_TRUE_VALUES = frozenset(('True', 'true', '1'))
+
+# Atomic design folders that name a component's story category
+_COMPONENT_CATEGORIES = frozenset(('atoms', 'molecules', 'organisms', 'templates', 'pages'))
+
+@lru_cache(maxsize=2048)
+def _component_category(directory: str) -> str:
+    """Story category for the components in a directory, resolved once per directory"""
+    for part in Path(directory).parts:
+        if part.lower() in _COMPONENT_CATEGORIES:
+            return part.title()
+
+    return 'Components'
 
 @dataclass
 class StoryTemplate:
@@ -24,6 +103,7 @@ class StoryTemplate:
     template_content: str
     controls_mapping: Dict[str, str]
     documentation_blocks: List[str]
+    compiled: Optional['jinja2.Template'] = field(default=None, repr=False, compare=False)
 
 @dataclass
 class GeneratedStory:
@@ -37,19 +117,61 @@ class GeneratedStory:
     documentation_added: List[str]
     status: str  # 'created', 'updated', 'skipped'
 
+# Story generator of a render worker process, built once by its initializer
+_worker_story_generator = None
+
+def _init_render_worker(config: Dict):
+    """Build the worker's own generator with the parent's configuration"""
+    global _worker_story_generator
+    _worker_story_generator = StoryGenerator()
+    _worker_story_generator.config = config
+
+def _render_story(component_info: Dict, existing_story: Optional[Path],
+                  story_generator: 'StoryGenerator' = None) -> Tuple[Optional[str], Dict, Optional[str]]:
+    """Render one story's content and metadata, returning the error message instead of raising"""
+    story_generator = story_generator or _worker_story_generator
+    try:
+        generator = story_generator.framework_generators[component_info.get('framework', 'react')]
+        story_content, metadata = generator.generate_story(component_info, existing_story)
+        return story_content, metadata, None
+    except Exception as e:
+        return None, {}, str(e)
+
 class StoryGenerator:
+    # Story files looked up next to a component, then in the shared stories directory
+    STORY_SUFFIXES = ('.stories.tsx', '.stories.jsx', '.stories.ts', '.stories.js', '.stories.mdx')
+    SHARED_STORY_SUFFIXES = ('.stories.tsx', '.stories.jsx')
+
     def __init__(self, config_path: str = None):
         self.project_root = Path.cwd()
         self.config = self._load_config(config_path)
         self.templates = self._load_templates()
-        self.template_env = jinja2.Environment(
+        self.generated_stories = []
+        # File names per directory, listed once per run instead of one stat per candidate
+        self._dir_entries: Dict[Path, Set[str]] = {}
+        # Rendered stories waiting to be written, by path, with the result that reports each one
+        self._pending_writes: Dict[Path, Tuple[str, GeneratedStory]] = {}
+
+    @cached_property
+    def template_env(self) -> 'jinja2.Environment':
+        """Jinja environment, imported and built on first use"""
+        import jinja2
+
+        # Story templates emit TS/Vue/Svelte source, so inline templates are not HTML-escaped
+        return jinja2.Environment(
             loader=jinja2.FileSystemLoader(Path(__file__).parent.parent / 'templates'),
-            autoescape=jinja2.select_autoescape()
+            autoescape=jinja2.select_autoescape(default_for_string=False),
+            keep_trailing_newline=True
         )
-        self.generated_stories = []
 
-        # Framework-specific generators
-        self.framework_generators = {
+    @cached_property
+    def framework_generators(self) -> Dict[str, Any]:
+        """Framework-specific generators, built when the first story is generated"""
+        # Parse each template once; every story then only renders the compiled form
+        for template in self.templates.values():
+            template.compiled = self.template_env.from_string(template.template_content)
+
+        return {
             'react': ReactStoryGenerator(self.config, self.templates, self.template_env),
             'vue': VueStoryGenerator(self.config, self.templates, self.template_env),
             'svelte': SvelteStoryGenerator(self.config, self.templates, self.template_env),
@@ -94,6 +216,8 @@ class StoryGenerator:
 
         if config_path and Path(config_path).exists():
             try:
+                import yaml
+
                 with open(config_path, 'r') as f:
                     user_config = yaml.safe_load(f)
                 default_config.update(user_config)
@@ -240,102 +364,187 @@ const args = defineArgs({
         """Generate stories for a list of components"""
         print("📚 Generating stories for components...")
 
-        generated = []
-
+        # Existing stories are looked up here; rendering is pure and runs as one batch
+        targets = []
         for component_info in components:
             try:
-                story = self._generate_story_for_component(component_info, auto_fix)
-                if story:
-                    generated.append(story)
-                    print(f"  ✅ {story.component_name}: {story.status}")
+                target = self._find_story_target(component_info)
+                if target:
+                    targets.append((component_info, *target))
             except Exception as e:
                 print(f"  ❌ Error generating story for {component_info.get('name', 'unknown')}: {e}")
 
+        rendered = iter(self._render_stories([
+            (component_info, existing_story) for component_info, _, existing_story in targets
+            if not self._keeps_existing_story(existing_story)
+        ]))
+
+        generated = []
+        for component_info, framework, existing_story in targets:
+            try:
+                if self._keeps_existing_story(existing_story):
+                    story = GeneratedStory(
+                        component_name=component_info['name'],
+                        component_path=component_info['path'],
+                        story_path=str(existing_story.relative_to(self.project_root)),
+                        framework=framework,
+                        stories_generated=[],
+                        controls_created=[],
+                        documentation_added=[],
+                        status='skipped'
+                    )
+                else:
+                    story_content, metadata, error = next(rendered)
+                    if error:
+                        print(f"  ❌ Error generating story for {component_info['name']}: {error}")
+                        continue
+                    story = self._queue_story(component_info, framework, existing_story, story_content, metadata)
+
+                generated.append(story)
+                print(f"  ✅ {story.component_name}: {story.status}")
+            except Exception as e:
+                print(f"  ❌ Error generating story for {component_info.get('name', 'unknown')}: {e}")
+
+        # Stories whose file could not be written are not reported as generated
+        failed = {id(story) for story in self._flush_story_writes()}
+        if failed:
+            generated = [story for story in generated if id(story) not in failed]
+
         self.generated_stories = generated
         print(f"✅ Generated {len(generated)} stories")
 
         return generated
 
-    def _generate_story_for_component(self, component_info: Dict, auto_fix: bool = False) -> Optional[GeneratedStory]:
-        """Generate a story for a single component"""
-        component_path = Path(component_info['path'])
+    def _find_story_target(self, component_info: Dict) -> Optional[Tuple[str, Optional[Path]]]:
+        """Framework and existing story of a component, or None if no generator handles it"""
         framework = component_info.get('framework', 'react')
 
         # Get framework-specific generator
-        generator = self.framework_generators.get(framework)
-        if not generator:
+        if framework not in self.framework_generators:
             print(f"  ⚠️ No generator available for framework: {framework}")
             return None
 
-        # Check if story already exists
-        existing_story = self._find_existing_story(component_path)
-        if existing_story and not self.config['story_generation']['update_existing']:
-            return GeneratedStory(
-                component_name=component_info['name'],
-                component_path=component_info['path'],
-                story_path=str(existing_story.relative_to(self.project_root)),
-                framework=framework,
-                stories_generated=[],
-                controls_created=[],
-                documentation_added=[],
-                status='skipped'
-            )
-
-        # Generate story content
-        try:
-            story_content, metadata = generator.generate_story(component_info, existing_story)
-
-            # Write story file
-            story_path = existing_story or self._create_story_path(component_path)
-            story_abs_path = self.project_root / story_path
-
-            # Backup existing story if configured
-            if existing_story and self.config['story_generation']['backup_existing']:
-                backup_path = story_abs_path.with_suffix('.backup')
-                existing_story.rename(backup_path)
-
-            # Write new story
-            story_abs_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(story_abs_path, 'w', encoding='utf-8') as f:
-                f.write(story_content)
-
-            return GeneratedStory(
-                component_name=component_info['name'],
-                component_path=component_info['path'],
-                story_path=str(story_path),
-                framework=framework,
-                stories_generated=metadata.get('stories', []),
-                controls_created=metadata.get('controls', []),
-                documentation_added=metadata.get('documentation', []),
-                status='updated' if existing_story else 'created'
-            )
+        # Check if story already exists. Phase 1 checks a superset of these locations, so
+        # its has_story=False stands when a story found here would be overwritten without
+        # a backup anyway; it may predate a story added since, which must be kept or backed up
+        component_path = Path(component_info['path'])
+        story_config = self.config['story_generation']
+        if (component_info.get('has_story') is False and story_config['update_existing']
+                and not story_config['backup_existing']):
+            existing_story = None
+        else:
+            existing_story = self._find_existing_story(component_path)
+        if not existing_story:
+            # Claim the new story's file now, so a later component resolving to the same
+            # file finds it, as it would if this story had already been written
+            story_path = self._create_story_path(component_path)
+            self._list_dir(story_path.parent).add(story_path.name)
+
+        return framework, existing_story
+
+    def _keeps_existing_story(self, existing_story: Optional[Path]) -> bool:
+        """Whether an existing story is left as is rather than regenerated"""
+        return bool(existing_story) and not self.config['story_generation']['update_existing']
+
+    def _render_stories(self, jobs: List[Tuple[Dict, Optional[Path]]]) -> List[Tuple[Optional[str], Dict, Optional[str]]]:
+        """Render story content for each (component, existing story) pair, in order"""
+        # Rendering is CPU-bound and independent per component, so large batches fan out
+        # to worker processes; only component dicts, paths and results cross the boundary
+        if len(jobs) > PARALLEL_RENDER_THRESHOLD:
+            with ProcessPoolExecutor(initializer=_init_render_worker, initargs=(self.config,)) as executor:
+                return list(executor.map(_render_story,
+                                         [component_info for component_info, _ in jobs],
+                                         [existing_story for _, existing_story in jobs],
+                                         chunksize=PARALLEL_CHUNK_SIZE))
+
+        return [_render_story(component_info, existing_story, self) for component_info, existing_story in jobs]
+
+    def _queue_story(self, component_info: Dict, framework: str, existing_story: Optional[Path],
+                     story_content: str, metadata: Dict) -> GeneratedStory:
+        """Back up any story being replaced and queue the new file for writing"""
+        story_path = existing_story or self._create_story_path(Path(component_info['path']))
+        story_abs_path = self.project_root / story_path
+
+        # Backup existing story if configured; a story queued earlier in this run is
+        # still in memory, so its pending write is redirected instead
+        if existing_story and self.config['story_generation']['backup_existing']:
+            backup_path = story_abs_path.with_suffix('.backup')
+            if story_abs_path in self._pending_writes:
+                self._pending_writes[backup_path] = self._pending_writes.pop(story_abs_path)
+            else:
+                # A hard link is a metadata-only backup and leaves the story readable until
+                # the new file replaces it; fall back to moving it where links are unsupported
+                try:
+                    os.link(story_abs_path, backup_path)
+                except OSError:
+                    story_abs_path.rename(backup_path)
+
+        story = GeneratedStory(
+            component_name=component_info['name'],
+            component_path=component_info['path'],
+            story_path=str(story_path),
+            framework=framework,
+            stories_generated=metadata.get('stories', []),
+            controls_created=metadata.get('controls', []),
+            documentation_added=metadata.get('documentation', []),
+            status='updated' if existing_story else 'created'
+        )
 
-        except Exception as e:
-            print(f"  ❌ Error generating story for {component_info['name']}: {e}")
-            return None
+        # Queue the new story; all files are written together once every story is rendered
+        story_abs_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pending_writes[story_abs_path] = (story_content, story)
+
+        return story
+
+    def _flush_story_writes(self) -> List[GeneratedStory]:
+        """Write every queued story file and return the stories whose write failed"""
+        pending = [(path, content, story) for path, (content, story) in self._pending_writes.items()]
+        self._pending_writes = {}
+
+        # Writes are independent and release the GIL, so large batches overlap in a thread pool
+        if len(pending) > PARALLEL_WRITE_THRESHOLD:
+            with ThreadPoolExecutor() as executor:
+                errors = list(executor.map(_write_story_file,
+                                           [path for path, _, _ in pending],
+                                           [content for _, content, _ in pending]))
+        else:
+            errors = [_write_story_file(path, content) for path, content, _ in pending]
+
+        failed = []
+        for (_, _, story), error in zip(pending, errors):
+            if error:
+                print(f"  ❌ Error writing story for {story.component_name}: {error}")
+                failed.append(story)
+
+        return failed
 
     def _find_existing_story(self, component_path: Path) -> Optional[Path]:
         """Find existing story file for a component"""
         component_name = component_path.stem
-        component_dir = component_path.parent
-
-        # Possible story file patterns
-        story_patterns = [
-            component_dir / f"{component_name}.stories.tsx",
-            component_dir / f"{component_name}.stories.jsx",
-            component_dir / f"{component_name}.stories.ts",
-            component_dir / f"{component_name}.stories.js",
-            component_dir / f"{component_name}.stories.mdx",
-            self.project_root / "stories" / f"{component_name}.stories.tsx",
-            self.project_root / "stories" / f"{component_name}.stories.jsx",
-        ]
+        stories_dir = self.project_root / "stories"
 
-        for pattern in story_patterns:
-            if pattern.exists():
-                return pattern
+        # Possible story file locations, checked against one listing per directory
+        for directory, suffixes in ((component_path.parent, self.STORY_SUFFIXES),
+                                    (stories_dir, self.SHARED_STORY_SUFFIXES)):
+            entries = self._list_dir(directory)
+            for suffix in suffixes:
+                if component_name + suffix in entries:
+                    return directory / (component_name + suffix)
 
         return None
 
+    def _list_dir(self, directory: Path) -> Set[str]:
+        """Names in a directory, cached for the run; missing directories list as empty"""
+        entries = self._dir_entries.get(directory)
+        if entries is None:
+            try:
+                with os.scandir(directory) as it:
+                    entries = {entry.name for entry in it}
+            except OSError:
+                entries = set()
+            self._dir_entries[directory] = entries
+        return entries
+
     def _create_story_path(self, component_path: Path) -> Path:
         """Create path for new story file"""
         component_name = component_path.stem
@@ -345,7 +554,7 @@ const args = defineArgs({
         story_path = component_dir / f"{component_name}.stories.tsx"
 
         # If that directory doesn't exist or is read-only, try stories directory
-        if not story_path.parent.exists() or not os.access(story_path.parent, os.W_OK):
+        if not _is_writable_dir(str(story_path.parent)):
             stories_dir = self.project_root / "stories"
             stories_dir.mkdir(exist_ok=True)
             story_path = stories_dir / f"{component_name}.stories.tsx"
@@ -360,8 +569,9 @@ const args = defineArgs({
 
         print("🎨 Syncing with Figma...")
 
-        # In a real implementation, this would use the Figma API
-        # For now, we'll simulate the sync
+        # In a real implementation, this would use the Figma API, issuing the per-file
+        # requests concurrently (a thread pool, as story writes use) rather than one
+        # after another. For now, we'll simulate the sync
         figma_sync_results = {
             'connected_components': 0,
             'updated_links': 0,
@@ -399,30 +609,33 @@ const args = defineArgs({
             if not story.documentation_added:
                 missing_autodocs.append(story)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("# Autodocs Missing Report\n\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            f.write("## Summary\n\n")
-            f.write(f"- **Total Stories Generated**: {len(self.generated_stories)}\n")
-            f.write(f"- **New Stories Created**: {len(created_stories)}\n")
-            f.write(f"- **Stories Updated**: {len(updated_stories)}\n")
-            f.write(f"- **Missing Autodocs**: {len(missing_autodocs)}\n\n")
-
-            if missing_autodocs:
-                f.write("## Components Missing Autodocs\n\n")
-                for story in missing_autodocs:
-                    f.write(f"- **{story.component_name}**\n")
-                    f.write(f"  - Path: `{story.story_path}`\n")
-                    f.write(f"  - Framework: {story.framework}\n")
-                    f.write(f"  - Status: {story.status}\n\n")
-
-            if created_stories:
-                f.write("## Newly Created Stories\n\n")
-                for story in created_stories:
-                    f.write(f"- **{story.component_name}** - `{story.story_path}`\n")
-                    f.write(f"  - Stories: {', '.join(story.stories_generated)}\n")
-                    f.write(f"  - Controls: {len(story.controls_created)} created\n\n")
+        # Assemble the report in memory and write it with a single call
+        report = [
+            "# Autodocs Missing Report\n\n",
+            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "## Summary\n\n",
+            f"- **Total Stories Generated**: {len(self.generated_stories)}\n"
+            f"- **New Stories Created**: {len(created_stories)}\n"
+            f"- **Stories Updated**: {len(updated_stories)}\n"
+            f"- **Missing Autodocs**: {len(missing_autodocs)}\n\n"
+        ]
+
+        if missing_autodocs:
+            report.append("## Components Missing Autodocs\n\n")
+            for story in missing_autodocs:
+                report.append(f"- **{story.component_name}**\n"
+                              f"  - Path: `{story.story_path}`\n"
+                              f"  - Framework: {story.framework}\n"
+                              f"  - Status: {story.status}\n\n")
+
+        if created_stories:
+            report.append("## Newly Created Stories\n\n")
+            for story in created_stories:
+                report.append(f"- **{story.component_name}** - `{story.story_path}`\n"
+                              f"  - Stories: {', '.join(story.stories_generated)}\n"
+                              f"  - Controls: {len(story.controls_created)} created\n\n")
+
+        Path(output_path).write_text(''.join(report), encoding='utf-8')
 
         print(f"📄 Autodocs missing report saved to: {output_path}")
 
@@ -463,8 +676,13 @@ const args = defineArgs({
                 'documentation_count': len(story.documentation_added)
             })
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        # Serialize first so the file is written in one call rather than per JSON chunk
+        if orjson is not None:
+            data = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(summary, indent=2).encode('utf-8')
+
+        Path(output_path).write_bytes(data)
 
         print(f"📊 Story generation summary saved to: {output_path}")
 
@@ -475,13 +693,14 @@ const args = defineArgs({
         # Load components
         if components_file and Path(components_file).exists():
             try:
-                with open(components_file, 'r') as f:
-                    if components_file.endswith('.json'):
-                        components = json.load(f)
-                    else:
-                        # Assume CSV format
-                        import csv
-                        components = list(csv.DictReader(f))
+                if components_file.endswith('.json'):
+                    components = _load_json(components_file)
+                else:
+                    # Assume CSV format; keep only rows flagged as needing a story
+                    import csv
+                    with open(components_file, 'r', newline='') as f:
+                        components = [row for row in csv.DictReader(f)
+                                      if row.get('needs_story') in _CSV_TRUE_VALUES]
 
                 if isinstance(components, dict) and 'components' in components:
                     components = components['components']
@@ -493,9 +712,8 @@ const args = defineArgs({
             # Look for component update map from Phase 1
             component_map_path = Path('component-update-map.json')
             if component_map_path.exists():
-                with open(component_map_path, 'r') as f:
-                    component_map = json.load(f)
-                    components = component_map.get('components', [])
+                component_map = _load_json(component_map_path)
+                components = component_map.get('components', [])
             else:
                 print("⚠️ No components file found. Run Phase 1 first.")
                 return {}
@@ -541,10 +759,12 @@ const args = defineArgs({
 class ReactStoryGenerator:
     """Generator for React components"""
 
-    def __init__(self, config: Dict, templates: Dict, template_env: jinja2.Environment):
+    def __init__(self, config: Dict, templates: Dict, template_env: 'jinja2.Environment'):
         self.config = config
         self.templates = templates
         self.template_env = template_env
+        # Compiled once by StoryGenerator; each story only renders it
+        self.story_template = templates['react_default'].compiled
 
     def generate_story(self, component_info: Dict, existing_story: Optional[Path] = None) -> Tuple[str, Dict]:
         """Generate React story content"""
@@ -563,8 +783,7 @@ class ReactStoryGenerator:
         stories = self._generate_stories(component_name, props, events)
 
         # Create content
-        template = self.templates['react_default']
-        content = template.template_content.format(
+        content = self.story_template.render(
             framework='react',
             component_name=component_name,
             component_path=self._get_import_path(component_path),
@@ -585,53 +804,33 @@ class ReactStoryGenerator:
 
     def _generate_arg_types(self, props: List[Dict]) -> str:
         """Generate argTypes for controls"""
-        arg_types = []
-
-        for prop in props:
-            prop_name = prop.get('name', '')
-            prop_type = prop.get('type', '').lower()
-
-            if not prop_name:
-                continue
+        return ',\n'.join(self._format_arg_type(prop) for prop in props if prop.get('name'))
 
-            # Map TypeScript types to Storybook controls
-            control_mapping = {
-                'string': 'text',
-                'number': 'number',
-                'boolean': 'boolean',
-                'enum': 'select',
-                'function': 'action'
-            }
-
-            control_type = control_mapping.get(prop_type, 'text')
-
-            arg_type_config = [
-                f"    {prop_name}: {{"
-            ]
+    def _format_arg_type(self, prop: Dict) -> str:
+        """Format the argTypes entry for one prop"""
+        prop_type = prop.get('type', '').lower()
 
-            # Add control type
-            arg_type_config.append(f"      control: '{control_type}'")
+        # Map TypeScript types to Storybook controls
+        control_type = _REACT_CONTROL_TYPES.get(prop_type, 'text')
 
-            # Add description if available
-            if prop.get('description'):
-                arg_type_config.append(f"      description: '{prop['description']}'")
+        # Add description if available
+        description = f"\n      description: '{prop['description']}'" if prop.get('description') else ''
 
-            # Add options for enums
-            if prop_type == 'enum' and prop.get('options'):
-                options_str = ', '.join([f"'{opt}'" for opt in prop['options']])
-                arg_type_config.append(f"      options: [{options_str}]")
+        # Add options for enums
+        options = ''
+        if prop_type == 'enum' and prop.get('options'):
+            options_str = ', '.join([f"'{opt}'" for opt in prop['options']])
+            options = f"\n      options: [{options_str}]"
 
-            arg_type_config.append("    }")
-            arg_types.append('\n'.join(arg_type_config))
-
-        return ',\n'.join(arg_types)
+        return f"    {prop['name']}: {{\n      control: '{control_type}'{description}{options}\n    }}"
 
     def _generate_stories(self, component_name: str, props: List[Dict], events: List[Dict]) -> str:
         """Generate story variants"""
         stories = []
 
         # Default story
-        default_args = self._get_default_args(props)
+        default_args_dict = self._get_default_args_dict(props)
+        default_args = self._format_args(default_args_dict)
         stories.append(f"export const Default: Story = {{\n  args: {default_args}\n}};")
 
         # Interactive story
@@ -639,17 +838,27 @@ class ReactStoryGenerator:
             interactive_story = f"export const Interactive: Story = {{\n  args: {default_args}\n}};"
             stories.append(interactive_story)
 
-        # Variant stories
-        variant_names = ['Primary', 'Secondary', 'Disabled']
-        for variant in variant_names:
-            variant_args = self._get_variant_args(variant.lower(), props)
+        # Variant stories, each setting the first prop named for it
+        variant_prop = self._find_prop_named('variant', props)
+        disabled_prop = self._find_prop_named('disabled', props)
+        variants = [
+            ('Primary', variant_prop, 'primary'),
+            ('Secondary', variant_prop, 'secondary'),
+            ('Disabled', disabled_prop, True)
+        ]
+        for variant, prop_name, value in variants:
+            variant_args = self._get_variant_args(default_args_dict, prop_name, value)
             if variant_args != default_args:
                 stories.append(f"export const {variant}: Story = {{\n  args: {variant_args}\n}};")
 
         return '\n\n'.join(stories)
 
-    def _get_default_args(self, props: List[Dict]) -> str:
-        """Generate default args object"""
+    def _format_args(self, args: Dict[str, Any]) -> str:
+        """Format an args object for a story"""
+        return _ARGS_ENCODER.encode(args) if args else '{}'
+
+    def _get_default_args_dict(self, props: List[Dict]) -> Dict[str, Any]:
+        """Default value for each prop, without props that have none"""
         args = {}
 
         for prop in props:
@@ -660,50 +869,26 @@ class ReactStoryGenerator:
                 continue
 
             # Set reasonable defaults based on type
-            if prop_type == 'string':
-                args[prop_name] = prop.get('default', 'Example')
-            elif prop_type == 'number':
-                args[prop_name] = prop.get('default', 0)
-            elif prop_type == 'boolean':
-                args[prop_name] = prop.get('default', False)
-            else:
-                args[prop_name] = prop.get('default', None)
+            args[prop_name] = prop.get('default', _DEFAULT_ARG_VALUES.get(prop_type))
 
         # Remove None values
-        args = {k: v for k, v in args.items() if v is not None}
+        return {k: v for k, v in args.items() if v is not None}
 
-        return json.dumps(args, indent=6) if args else '{}'
+    def _find_prop_named(self, name_fragment: str, props: List[Dict]) -> Optional[str]:
+        """Name of the first prop whose name contains the fragment"""
+        for prop in props:
+            if name_fragment in prop.get('name', '').lower():
+                return prop['name']
+        return None
 
-    def _get_variant_args(self, variant: str, props: List[Dict]) -> str:
+    def _get_variant_args(self, default_args: Dict[str, Any], prop_name: Optional[str], value: Any) -> str:
         """Generate args for specific variant"""
-        args = self._get_default_args(props)
-
-        # Modify args based on variant
-        if variant == 'primary':
-            for prop in props:
-                if 'variant' in prop.get('name', '').lower():
-                    args = json.loads(args)
-                    args[prop['name']] = 'primary'
-                    break
-        elif variant == 'secondary':
-            for prop in props:
-                if 'variant' in prop.get('name', '').lower():
-                    args = json.loads(args)
-                    args[prop['name']] = 'secondary'
-                    break
-        elif variant == 'disabled':
-            for prop in props:
-                if 'disabled' in prop.get('name', '').lower():
-                    args = json.loads(args)
-                    args[prop['name']] = True
-                    break
-
-        return json.dumps(args, indent=6) if args else '{}'
+        return self._format_args({**default_args, prop_name: value} if prop_name else default_args)
 
     def _get_import_path(self, component_path: str) -> str:
         """Get import path for component"""
         # Convert relative path to import path
-        path_obj = Path(component_path)
+        path_obj = PurePosixPath(component_path)
 
         # Remove extension and directory prefix
         import_path = str(path_obj.with_suffix(''))
@@ -716,16 +901,7 @@ class ReactStoryGenerator:
 
     def _get_component_category(self, component_path: str) -> str:
         """Get component category from path"""
-        path_parts = Path(component_path).parts
-
-        # Look for category indicators in path
-        categories = ['atoms', 'molecules', 'organisms', 'templates', 'pages']
-
-        for part in path_parts:
-            if part.lower() in categories:
-                return part.title()
-
-        return 'Components'
+        return _component_category(os.path.dirname(component_path))
 
     def _get_component_description(self, component_info: Dict) -> str:
         """Generate component description"""
@@ -750,10 +926,11 @@ class ReactStoryGenerator:
 class VueStoryGenerator:
     """Generator for Vue components"""
 
-    def __init__(self, config: Dict, templates: Dict, template_env: jinja2.Environment):
+    def __init__(self, config: Dict, templates: Dict, template_env: 'jinja2.Environment'):
         self.config = config
         self.templates = templates
         self.template_env = template_env
+        self.story_template = templates['vue_default'].compiled
 
     def generate_story(self, component_info: Dict, existing_story: Optional[Path] = None) -> Tuple[str, Dict]:
         """Generate Vue story content"""
@@ -762,12 +939,10 @@ class VueStoryGenerator:
         metadata = component_info.get('metadata', {})
 
         # Generate Vue-specific story content
-        template = self.templates['vue_default']
-
         args_definition = self._generate_args_definition(metadata.get('props', []))
         documentation = self._generate_documentation(component_info, metadata)
 
-        content = template.template_content.format(
+        content = self.story_template.render(
             component_name=component_name,
             component_path=self._get_import_path(component_path),
             args_definition=args_definition,
@@ -844,7 +1019,7 @@ class VueStoryGenerator:
 
     def _get_import_path(self, component_path: str) -> str:
         """Get import path for Vue component"""
-        path_obj = Path(component_path)
+        path_obj = PurePosixPath(component_path)
         import_path = str(path_obj)
 
         if import_path.startswith('src/'):
@@ -865,10 +1040,11 @@ class VueStoryGenerator:
 class SvelteStoryGenerator:
     """Generator for Svelte components"""
 
-    def __init__(self, config: Dict, templates: Dict, template_env: jinja2.Environment):
+    def __init__(self, config: Dict, templates: Dict, template_env: 'jinja2.Environment'):
         self.config = config
         self.templates = templates
         self.template_env = template_env
+        self.story_template = templates['svelte_default'].compiled
 
     def generate_story(self, component_info: Dict, existing_story: Optional[Path] = None) -> Tuple[str, Dict]:
         """Generate Svelte story content"""
@@ -876,12 +1052,10 @@ class SvelteStoryGenerator:
         component_path = component_info['path']
         metadata = component_info.get('metadata', {})
 
-        template = self.templates['svelte_default']
-
         arg_types = self._generate_arg_types(metadata.get('props', []))
         stories = self._generate_svelte_stories(component_name, metadata.get('props', []))
 
-        content = template.template_content.format(
+        content = self.story_template.render(
             component_name=component_name,
             component_path=self._get_import_path(component_path),
             component_category=self._get_component_category(component_path),
@@ -909,15 +1083,7 @@ class SvelteStoryGenerator:
             if not prop_name:
                 continue
 
-            control_mapping = {
-                'string': 'text',
-                'number': 'number',
-                'boolean': 'boolean',
-                'array': 'object',
-                'object': 'object'
-            }
-
-            control_type = control_mapping.get(prop_type, 'text')
+            control_type = _SVELTE_CONTROL_TYPES.get(prop_type, 'text')
 
             arg_types.append(f"    {prop_name}: {{ control: '{control_type}' }}")
 
@@ -938,7 +1104,7 @@ class SvelteStoryGenerator:
 
     def _get_import_path(self, component_path: str) -> str:
         """Get import path for Svelte component"""
-        path_obj = Path(component_path)
+        path_obj = PurePosixPath(component_path)
         import_path = str(path_obj)
 
         if import_path.startswith('src/'):
@@ -948,15 +1114,7 @@ class SvelteStoryGenerator:
 
     def _get_component_category(self, component_path: str) -> str:
         """Get component category"""
-        path_parts = Path(component_path).parts
-
-        categories = ['atoms', 'molecules', 'organisms', 'templates', 'pages']
-
-        for part in path_parts:
-            if part.lower() in categories:
-                return part.title()
-
-        return 'Components'
+        return _component_category(os.path.dirname(component_path))
 
     def _get_component_description(self, component_info: Dict) -> str:
         """Generate component description"""
@@ -971,10 +1129,11 @@ class SvelteStoryGenerator:
 class WebComponentStoryGenerator:
     """Generator for Web Components"""
 
-    def __init__(self, config: Dict, templates: Dict, template_env: jinja2.Environment):
+    def __init__(self, config: Dict, templates: Dict, template_env: 'jinja2.Environment'):
         self.config = config
         self.templates = templates
         self.template_env = template_env
+        self.story_template = templates['react_default'].compiled  # Reuse React template with modifications
 
     def generate_story(self, component_info: Dict, existing_story: Optional[Path] = None) -> Tuple[str, Dict]:
         """Generate Web Component story content"""
@@ -983,12 +1142,10 @@ class WebComponentStoryGenerator:
         metadata = component_info.get('metadata', {})
 
         # For Web Components, we'll use a simplified React-like template
-        template = self.templates['react_default']  # Reuse React template with modifications
-
         arg_types = self._generate_web_component_arg_types(metadata.get('props', []))
         stories = self._generate_web_component_stories(component_name)
 
-        content = template.template_content.format(
+        content = self.story_template.render(
             framework='html',
             component_name=component_name,
             component_path=self._get_import_path(component_path),
@@ -1035,7 +1192,7 @@ class WebComponentStoryGenerator:
 
     def _get_import_path(self, component_path: str) -> str:
         """Get import path for Web Component"""
-        path_obj = Path(component_path)
+        path_obj = PurePosixPath(component_path)
         import_path = str(path_obj.with_suffix(''))
 
         if import_path.startswith('src/'):
@@ -1045,15 +1202,7 @@ class WebComponentStoryGenerator:
 
     def _get_component_category(self, component_path: str) -> str:
         """Get component category"""
-        path_parts = Path(component_path).parts
-
-        categories = ['atoms', 'molecules', 'organisms', 'templates', 'pages']
-
-        for part in path_parts:
-            if part.lower() in categories:
-                return part.title()
-
-        return 'Components'
+        return _component_category(os.path.dirname(component_path))
 
     def _get_component_description(self, component_info: Dict) -> str:
         """Generate component description"""